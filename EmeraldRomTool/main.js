@@ -66,9 +66,11 @@ ipcMain.handle('select-rom-file', async () => {
   if (!result.canceled && result.filePaths.length > 0) {
     const filePath = result.filePaths[0];
     const buffer = fs.readFileSync(filePath);
+    // The Buffer is structured-cloned to the renderer as a Uint8Array, no
+    // per-byte number array needed
     return {
       name: path.basename(filePath),
-      buffer: Array.from(buffer)
+      buffer
     };
   }
   
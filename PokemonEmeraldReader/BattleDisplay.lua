@@ -8,6 +8,105 @@ local PokemonReader = require("PokemonReader")
 
 local BattleDisplay = {}
 
+-- Rendered bars by width, then filled count (only a few dozen distinct strings)
+local barCache = {}
+
+-- Rendered tier breakdowns by rating table (weak keys, so dropped ratings free their text)
+local breakdownCache = setmetatable({}, {__mode = "k"})
+
+-- Catch advice shown for each randomizer tier
+local TIER_RECOMMENDATIONS = {
+    S = "⭐ EXCELLENT CATCH! Top-tier Pokemon for randomizers!",
+    A = "✨ Great Pokemon! Highly recommended for your team.",
+    B = "👍 Solid choice. Will perform well with good moves.",
+    C = "⚡ Usable, but may need replacement later.",
+    D = "⚠️  Low tier. Only use if no better options available."
+}
+
+-- Tier ratings by species, and the ROMData.data.pokemon table they were computed from
+local tierCache, tierSource = {}, nil
+
+-- Forget cached tiers (call after patching ROM data in place)
+function BattleDisplay.clearTierCache()
+    tierCache = {}
+end
+
+-- Calculate randomizer tier for a Pokemon
+function BattleDisplay.calculateRandomizerTier(pokemonId)
+    if not ROMData.data.initialized then ROMData.init() end
+    local P = ROMData.data.pokemon
+    if not P or not P.bst[pokemonId] then return nil end
+    
+    -- Tiers are memoized per species; a ROM data reload builds a new pokemon table,
+    -- so a different table means every cached tier is stale
+    if P ~= tierSource then
+        tierCache, tierSource = {}, P
+    end
+    local cached = tierCache[pokemonId]
+    if cached then return cached end
+    
+    -- Base stat total weight
+    local bstScore = math.min(P.bst[pokemonId] / 600, 1.0) * 100
+    
+    -- HP is crucial in randomizers
+    local hpScore = (P.hp[pokemonId] / 255) * 150
+    
+    -- Speed for survival
+    local speedScore = (P.speed[pokemonId] / 200) * 130
+    
+    -- Defensive stats
+    local defenseScore = ((P.defense[pokemonId] + P.spDefense[pokemonId]) / 400) * 120
+    
+    -- Type defensive score
+    local type1, type2 = P.type1[pokemonId], P.type2[pokemonId]
+    local typeScore = ROMData.calculateTypeDefensiveScore(type1, type2) * 100
+    
+    -- Calculate weighted total
+    local totalScore = (
+        bstScore * 0.30 +
+        hpScore * 0.20 +
+        speedScore * 0.15 +
+        defenseScore * 0.20 +
+        typeScore * 0.15
+    )
+    
+    -- Determine tier
+    local tier, stars
+    if totalScore >= 90 then
+        tier = "S"
+        stars = 5
+    elseif totalScore >= 75 then
+        tier = "A"
+        stars = 4
+    elseif totalScore >= 60 then
+        tier = "B"
+        stars = 3
+    elseif totalScore >= 45 then
+        tier = "C"
+        stars = 2
+    else
+        tier = "D"
+        stars = 1
+    end
+    
+    local result = {
+        tier = tier,
+        stars = stars,
+        score = math.floor(totalScore),
+        recommendation = TIER_RECOMMENDATIONS[tier],
+        details = {
+            bst = math.floor(bstScore),
+            hp = math.floor(hpScore),
+            speed = math.floor(speedScore),
+            defense = math.floor(defenseScore),
+            typing = math.floor(typeScore)
+        }
+    }
+    
+    tierCache[pokemonId] = result
+    return result
+end
+
 -- Read enemy Pokemon in battle
 function BattleDisplay.readEnemyPokemon()
     local battleState = Pointers.getBattleState()
@@ -22,78 +121,67 @@ function BattleDisplay.readEnemyPokemon()
     local enemyPokemon = PokemonReader.readPokemon(enemyPartyAddr + 4, false)
     if enemyPokemon then
         -- Add tier rating
-        enemyPokemon.tierRating = ROMData.calculateRandomizerTier(enemyPokemon.species)
+        enemyPokemon.tierRating = BattleDisplay.calculateRandomizerTier(enemyPokemon.species)
     end
     
     return enemyPokemon, battleState
 end
 
+-- Horizontal rule framing the battle displays
+local RULE = string.rep("═", 50)
+
 -- Display wild Pokemon encounter
 function BattleDisplay.displayWildEncounter(pokemon)
-    console.log("\n=== WILD POKEMON ENCOUNTER ===")
-    console.log(string.rep("═", 50))
+    local lines = {"\n=== WILD POKEMON ENCOUNTER ===", RULE}
     
     -- Pokemon name and level
     local name = pokemon.baseData and pokemon.baseData.name or "???"
-    console.log(string.format("Wild %s appeared! (Lv.%d)", name, pokemon.battleStats.level or 0))
+    lines[#lines + 1] = string.format("Wild %s appeared! (Lv.%d)", name, pokemon.battleStats.level or 0)
     
+    BattleDisplay.renderPokemonPanel(pokemon, lines)
+    console.log(table.concat(lines, "\n"))
+end
+
+-- Append the battle panel shared by wild and trainer battles (no header) to lines
+function BattleDisplay.renderPokemonPanel(pokemon, lines)
     -- Types
     if pokemon.baseData then
-        local type1 = ROMData.getTypeName(pokemon.baseData.type1) or "???"
-        local type2 = ROMData.getTypeName(pokemon.baseData.type2) or "???"
+        local type1 = pokemon.type1Name or "???"
+        local type2 = pokemon.type2Name or "???"
         if type1 == type2 then
-            console.log(string.format("Type: %s", type1))
+            lines[#lines + 1] = "Type: " .. type1
         else
-            console.log(string.format("Types: %s / %s", type1, type2))
+            lines[#lines + 1] = "Types: " .. type1 .. " / " .. type2
         end
     end
     
     -- Tier rating with visual stars
     if pokemon.tierRating then
         local stars = string.rep("★", pokemon.tierRating.stars) .. string.rep("☆", 5 - pokemon.tierRating.stars)
-        console.log(string.format("\nRANDOMIZER TIER: %s %s", pokemon.tierRating.tier, stars))
-        console.log(string.format("Overall Score: %d/100", pokemon.tierRating.score))
+        lines[#lines + 1] = string.format("\nRANDOMIZER TIER: %s %s", pokemon.tierRating.tier, stars)
+        lines[#lines + 1] = string.format("Overall Score: %d/100", pokemon.tierRating.score)
         
         -- Tier breakdown
-        console.log("\nTier Analysis:")
-        console.log(string.format("  BST:     %3d [%s]", 
-            pokemon.tierRating.details.bst,
-            BattleDisplay.makeBar(pokemon.tierRating.details.bst, 100, 20)))
-        console.log(string.format("  HP:      %3d [%s]", 
-            pokemon.tierRating.details.hp,
-            BattleDisplay.makeBar(pokemon.tierRating.details.hp, 150, 20)))
-        console.log(string.format("  Speed:   %3d [%s]", 
-            pokemon.tierRating.details.speed,
-            BattleDisplay.makeBar(pokemon.tierRating.details.speed, 130, 20)))
-        console.log(string.format("  Defense: %3d [%s]", 
-            pokemon.tierRating.details.defense,
-            BattleDisplay.makeBar(pokemon.tierRating.details.defense, 120, 20)))
-        console.log(string.format("  Typing:  %3d [%s]", 
-            pokemon.tierRating.details.typing,
-            BattleDisplay.makeBar(pokemon.tierRating.details.typing, 100, 20)))
+        lines[#lines + 1] = "\nTier Analysis:"
+        lines[#lines + 1] = BattleDisplay.getTierBreakdown(pokemon.tierRating)
         
         -- Recommendation
-        console.log("\n" .. BattleDisplay.getTierRecommendation(pokemon.tierRating.tier))
+        lines[#lines + 1] = "\n" .. (pokemon.tierRating.recommendation or BattleDisplay.getTierRecommendation(pokemon.tierRating.tier))
     end
     
     -- Stats
-    if pokemon.battleStats then
-        console.log("\nStats:")
-        console.log(string.format("  HP:  %3d | ATK: %3d | DEF: %3d",
-            pokemon.battleStats.maxHP or 0,
-            pokemon.battleStats.attack or 0,
-            pokemon.battleStats.defense or 0))
-        console.log(string.format("  SPE: %3d | SPA: %3d | SPD: %3d",
-            pokemon.battleStats.speed or 0,
-            pokemon.battleStats.spAttack or 0,
-            pokemon.battleStats.spDefense or 0))
+    if pokemon.stats then
+        local s = pokemon.stats
+        lines[#lines + 1] = "\nStats:"
+        lines[#lines + 1] = string.format("  HP:  %3d | ATK: %3d | DEF: %3d\n  SPE: %3d | SPA: %3d | SPD: %3d",
+            s[1], s[2], s[3], s[4], s[5], s[6])
     end
     
     -- Ability
-    local abilityName = ROMData.getAbilityName(pokemon.ability) or "???"
-    console.log(string.format("\nAbility: %s", abilityName))
+    lines[#lines + 1] = "\nAbility: " .. (pokemon.abilityName or "???")
     
-    console.log(string.rep("═", 50))
+    lines[#lines + 1] = RULE
+    return lines
 end
 
 -- Create a visual bar
@@ -102,38 +190,71 @@ function BattleDisplay.makeBar(value, max, width)
     filled = math.min(filled, width)
     filled = math.max(filled, 0)
     
-    return string.rep("█", filled) .. string.rep("░", width - filled)
+    local bars = barCache[width]
+    if not bars then
+        bars = {}
+        barCache[width] = bars
+    end
+    
+    local bar = bars[filled]
+    if bar then return bar end
+    
+    bar = string.rep("█", filled) .. string.rep("░", width - filled)
+    bars[filled] = bar
+    return bar
+end
+
+-- Tier breakdown rows: detail field, label, bar max
+local TIER_BREAKDOWN = {
+    {"bst", "BST:    ", 100},
+    {"hp", "HP:     ", 150},
+    {"speed", "Speed:  ", 130},
+    {"defense", "Defense:", 120},
+    {"typing", "Typing: ", 100}
+}
+
+-- Render the tier breakdown once per rating
+-- (ratings are memoized per species, so each species renders only once)
+function BattleDisplay.getTierBreakdown(tierRating)
+    local breakdown = breakdownCache[tierRating]
+    if breakdown then return breakdown end
+    
+    local details = tierRating.details
+    local lines = {}
+    for i, row in ipairs(TIER_BREAKDOWN) do
+        local value = details[row[1]]
+        lines[i] = string.format("  %s %3d [%s]", row[2], value, BattleDisplay.makeBar(value, row[3], 20))
+    end
+    
+    breakdown = table.concat(lines, "\n")
+    breakdownCache[tierRating] = breakdown
+    return breakdown
 end
 
 -- Get tier recommendation
 function BattleDisplay.getTierRecommendation(tier)
-    local recommendations = {
-        S = "⭐ EXCELLENT CATCH! Top-tier Pokemon for randomizers!",
-        A = "✨ Great Pokemon! Highly recommended for your team.",
-        B = "👍 Solid choice. Will perform well with good moves.",
-        C = "⚡ Usable, but may need replacement later.",
-        D = "⚠️  Low tier. Only use if no better options available."
-    }
-    return recommendations[tier] or "❓ Unknown tier"
+    return TIER_RECOMMENDATIONS[tier] or "❓ Unknown tier"
 end
 
 -- Display type effectiveness
 function BattleDisplay.displayTypeEffectiveness(attackerTypes, defenderTypes)
     console.log("\n=== TYPE EFFECTIVENESS ===")
     
+    -- Resolve the lookups once for the whole table
+    local getTypeEffectiveness = ROMData.getTypeEffectiveness
+    local getTypeName = ROMData.getTypeName
+    
     -- Your attacks vs enemy
     console.log("Your attacks:")
     for _, atkType in ipairs(attackerTypes) do
         local effectiveness = 10  -- Normal
         
         for _, defType in ipairs(defenderTypes) do
-            if ROMData.data.typeChart[atkType] and ROMData.data.typeChart[atkType][defType] then
-                local eff = ROMData.data.typeChart[atkType][defType]
-                effectiveness = (effectiveness * eff) / 10
-            end
+            local eff = getTypeEffectiveness(atkType, defType)
+            effectiveness = (effectiveness * eff) / 10
         end
         
-        local typeName = ROMData.getTypeName(atkType) or "???"
+        local typeName = getTypeName(atkType) or "???"
         local effectStr = ""
         
         if effectiveness >= 20 then
@@ -152,16 +273,15 @@ end
 
 -- Display trainer battle
 function BattleDisplay.displayTrainerBattle(pokemon, trainerName)
-    console.log("\n=== TRAINER BATTLE ===")
-    console.log(string.rep("═", 50))
+    local lines = {"\n=== TRAINER BATTLE ===", RULE}
     
     -- Trainer info
-    console.log(string.format("Trainer %s sent out %s!", 
+    lines[#lines + 1] = string.format("Trainer %s sent out %s!", 
         trainerName or "???", 
-        pokemon.baseData and pokemon.baseData.name or "???"))
+        pokemon.baseData and pokemon.baseData.name or "???")
     
-    -- Continue with similar display as wild
-    BattleDisplay.displayWildEncounter(pokemon)
+    BattleDisplay.renderPokemonPanel(pokemon, lines)
+    console.log(table.concat(lines, "\n"))
 end
 
 return BattleDisplay
@@ -5,13 +5,21 @@
 local Memory = {}
 
 -- Memory domain mapping based on GBA memory map
--- Bitwise operation compatibility
-local band = _VERSION >= "Lua 5.3" and function(a,b) return a & b end or bit.band
-local bor = _VERSION >= "Lua 5.3" and function(a,b) return a | b end or bit.bor
-local bxor = _VERSION >= "Lua 5.3" and function(a,b) return a ~ b end or bit.bxor
-local bnot = _VERSION >= "Lua 5.3" and function(a) return ~a end or bit.bnot
-local lshift = _VERSION >= "Lua 5.3" and function(a,b) return a << b end or bit.lshift
-local rshift = _VERSION >= "Lua 5.3" and function(a,b) return a >> b end or bit.rshift
+-- Bitwise operation compatibility (picked once at load; 5.3+ operators compiled from source)
+local band, bor, bxor, bnot, lshift, rshift
+if _VERSION >= "Lua 5.3" then
+    band, bor, bxor, bnot, lshift, rshift = assert(load([[
+        return function(a,b) return a & b end,
+               function(a,b) return a | b end,
+               function(a,b) return a ~ b end,
+               function(a) return ~a end,
+               function(a,b) return a << b end,
+               function(a,b) return a >> b end
+    ]]))()
+else
+    band, bor, bxor, bnot = bit.band, bit.bor, bit.bxor, bit.bnot
+    lshift, rshift = bit.lshift, bit.rshift
+end
 
 
 Memory.domains = {
@@ -257,6 +265,64 @@ function Memory.readbytes(addr, length)
     return bytes
 end
 
+-- Read a block of bytes with a single emulator call
+-- Returns a 0-indexed table (bytes[0] is the byte at addr), or nil on failure
+function Memory.readbyterange(addr, length)
+    if not addr or not length or length <= 0 then
+        return nil
+    end
+    
+    Memory.stats.reads = Memory.stats.reads + 1
+    
+    local domain = Memory.getDomain(addr)
+    if not domain then
+        Memory.stats.failures = Memory.stats.failures + 1
+        return nil
+    end
+    
+    local offset = Memory.getOffset(addr)
+    
+    -- The whole range must be reachable through one domain
+    if Memory.requiresSystemBus(addr) or Memory.requiresSystemBus(addr + length - 1) then
+        domain = "System Bus"
+        offset = addr
+        Memory.stats.systemBusFallbacks = Memory.stats.systemBusFallbacks + 1
+    end
+    
+    local success, bytes = pcall(memory.readbyterange, offset, length, domain)
+    if (not success or not bytes) and Memory.USE_SYSTEM_BUS_FALLBACK and domain ~= "System Bus" then
+        Memory.stats.systemBusFallbacks = Memory.stats.systemBusFallbacks + 1
+        success, bytes = pcall(memory.readbyterange, addr, length, "System Bus")
+    end
+    
+    if success and bytes then
+        -- BizHawk returns a 0-indexed table; shift 1-indexed results from older builds
+        if bytes[0] == nil and bytes[1] ~= nil then
+            local shifted = {}
+            for i = 0, length - 1 do
+                shifted[i] = bytes[i + 1]
+            end
+            bytes = shifted
+        end
+        if bytes[length - 1] ~= nil then
+            return bytes
+        end
+    end
+    
+    -- Last resort: byte-by-byte reads
+    local fallback = Memory.readbytes(addr, length)
+    if not fallback then
+        Memory.stats.failures = Memory.stats.failures + 1
+        return nil
+    end
+    
+    local result = {}
+    for i = 0, length - 1 do
+        result[i] = fallback[i + 1]
+    end
+    return result
+end
+
 -- Read null-terminated string
 function Memory.readstring(addr, maxLength)
     if not addr then return nil end
@@ -103,14 +103,18 @@ Pointers.saveBlock2Offsets = {
 }
 
 -- Cache for frequently accessed pointers
+-- Entries stay valid until DMA moves the block (its IWRAM pointer changes)
 local cache = {
     saveBlock1 = nil,
-    saveBlock2 = nil,
-    lastCacheTime = 0
+    saveBlock2 = nil
 }
 
--- Cache lifetime in frames (5 seconds at 60fps)
-local CACHE_LIFETIME = 300
+-- Party address cached until the SaveBlock1 pointer moves or its count stops looking valid
+local partyBase = nil
+local partyBasePtr = 0
+
+-- Offset of each party slot from the party address (4-byte count, then 100 bytes per Pokemon)
+local SLOT_OFFSETS = {[0] = 4, [1] = 104, [2] = 204, [3] = 304, [4] = 404, [5] = 504}
 
 -- Read and validate a pointer
 function Pointers.readPointer(name)
@@ -132,35 +136,66 @@ function Pointers.readPointer(name)
     return pointer
 end
 
--- Get SaveBlock1 with caching
-function Pointers.getSaveBlock1()
-    local currentFrame = emu.framecount()
+-- Widest IWRAM span worth covering with one bulk read
+local MAX_BULK_SPAN = 0x100
+
+-- Read several pointers with one memory access spanning all of them
+-- Returns pointers[name] for valid ones and errors[name] for the rest
+function Pointers.readPointersBulk(names)
+    local pointers, errors = {}, {}
+    
+    local lo, hi
+    for _, name in ipairs(names) do
+        local addr = Pointers.addresses[name]
+        if addr then
+            if not lo or addr < lo then lo = addr end
+            if not hi or addr + 4 > hi then hi = addr + 4 end
+        end
+    end
     
-    -- Check cache
-    if cache.saveBlock1 and (currentFrame - cache.lastCacheTime) < CACHE_LIFETIME then
-        return cache.saveBlock1
+    -- Pointers too far apart are read one at a time
+    if lo and hi - lo > MAX_BULK_SPAN then
+        for _, name in ipairs(names) do
+            pointers[name], errors[name] = Pointers.readPointer(name)
+        end
+        return pointers, errors
     end
     
-    -- Read pointer
-    local ptr, err = Pointers.readPointer("gSaveBlock1")
-    if not ptr then
-        -- For patched ROMs, return dummy structure with hardcoded addresses
-        return {
-            pointer = 0,
-            teamAndItems = PARTY_ADDRESS,  -- Use hardcoded address
-            playerName = PARTY_ADDRESS - 0x234,  -- Estimate player data location
-            playerGender = PARTY_ADDRESS - 0x234 + 0x08,
-            playerTrainerId = PARTY_ADDRESS - 0x234 + 0x0A,
-            playerSecretId = PARTY_ADDRESS - 0x234 + 0x0C,
-            playTimeHours = PARTY_ADDRESS - 0x234 + 0x0E,
-            playTimeFrames = PARTY_ADDRESS - 0x234 + 0x10,
-            money = PARTY_ADDRESS - 0x234 + 0x490,
-            coins = PARTY_ADDRESS - 0x234 + 0x494
-        }
+    local bytes = lo and Memory.readbyterange(lo, hi - lo)
+    
+    for _, name in ipairs(names) do
+        local addr = Pointers.addresses[name]
+        if not addr then
+            errors[name] = "Unknown pointer: " .. tostring(name)
+        elseif not bytes then
+            errors[name] = "Failed to read pointer at " .. string.format("0x%08X", addr)
+        else
+            local off = addr - lo
+            local pointer = bytes[off] + bytes[off + 1] * 0x100 + bytes[off + 2] * 0x10000 + bytes[off + 3] * 0x1000000
+            
+            -- Validate pointer is in valid EWRAM range
+            if pointer < 0x02000000 or pointer >= 0x02040000 then
+                errors[name] = "Invalid pointer value: " .. string.format("0x%08X", pointer)
+            else
+                pointers[name] = pointer
+            end
+        end
+    end
+    
+    return pointers, errors
+end
+
+-- SaveBlock1 structs by base pointer (DMA cycles among a few EWRAM addresses)
+local sb1Structs = {}
+
+-- Build the SaveBlock1 address struct for a base pointer
+local function buildSaveBlock1Struct(ptr)
+    local saveBlock1 = sb1Structs[ptr]
+    if saveBlock1 then
+        return saveBlock1
     end
     
-    -- Create SaveBlock1 structure
-    local saveBlock1 = {
+    saveBlock1 = {
         pointer = ptr,
         -- Add all offsets to the base pointer
         playerName = ptr + Pointers.saveBlock1Offsets.playerName,
@@ -187,48 +222,85 @@ function Pointers.getSaveBlock1()
         pcBoxes = ptr + Pointers.saveBlock1Offsets.pcBoxes
     }
     
-    -- Update cache
-    cache.saveBlock1 = saveBlock1
-    cache.lastCacheTime = currentFrame
-    
+    sb1Structs[ptr] = saveBlock1
     return saveBlock1
 end
 
+-- Build the SaveBlock2 address struct for a base pointer
+local function buildSaveBlock2Struct(ptr)
+    return {
+        pointer = ptr,
+        encryptionKey = ptr + Pointers.saveBlock2Offsets.encryptionKey,
+        pokedexOwned = ptr + Pointers.saveBlock2Offsets.pokedexOwned,
+        pokedexSeen = ptr + Pointers.saveBlock2Offsets.pokedexSeen
+    }
+end
+
+-- Both SaveBlock pointers sit side by side in IWRAM
+local SAVE_BLOCK_POINTERS = {"gSaveBlock1", "gSaveBlock2"}
+
+-- Refresh both SaveBlock caches from a single bulk pointer read
+local function refillSaveBlocks()
+    local pointers, errors = Pointers.readPointersBulk(SAVE_BLOCK_POINTERS)
+    cache.saveBlock1 = pointers.gSaveBlock1 and buildSaveBlock1Struct(pointers.gSaveBlock1)
+    cache.saveBlock2 = pointers.gSaveBlock2 and buildSaveBlock2Struct(pointers.gSaveBlock2)
+    return errors
+end
+
+-- True while a cached block still matches the live IWRAM pointer (one u32 read)
+local function isCurrent(block, pointerName)
+    return block and Memory.read_u32_le(Pointers.addresses[pointerName]) == block.pointer
+end
+
+-- Get SaveBlock1 with caching
+function Pointers.getSaveBlock1()
+    -- Check cache
+    if isCurrent(cache.saveBlock1, "gSaveBlock1") then
+        return cache.saveBlock1
+    end
+    
+    -- Read pointers (refreshes SaveBlock2 as well)
+    refillSaveBlocks()
+    if not cache.saveBlock1 then
+        -- For patched ROMs, return dummy structure with hardcoded addresses
+        return {
+            pointer = 0,
+            teamAndItems = PARTY_ADDRESS,  -- Use hardcoded address
+            playerName = PARTY_ADDRESS - 0x234,  -- Estimate player data location
+            playerGender = PARTY_ADDRESS - 0x234 + 0x08,
+            playerTrainerId = PARTY_ADDRESS - 0x234 + 0x0A,
+            playerSecretId = PARTY_ADDRESS - 0x234 + 0x0C,
+            playTimeHours = PARTY_ADDRESS - 0x234 + 0x0E,
+            playTimeFrames = PARTY_ADDRESS - 0x234 + 0x10,
+            money = PARTY_ADDRESS - 0x234 + 0x490,
+            coins = PARTY_ADDRESS - 0x234 + 0x494
+        }
+    end
+    
+    return cache.saveBlock1
+end
+
 -- Get SaveBlock2 with caching
 function Pointers.getSaveBlock2()
-    local currentFrame = emu.framecount()
-    
     -- Check cache
-    if cache.saveBlock2 and (currentFrame - cache.lastCacheTime) < CACHE_LIFETIME then
+    if isCurrent(cache.saveBlock2, "gSaveBlock2") then
         return cache.saveBlock2
     end
     
-    -- Read pointer
-    local ptr, err = Pointers.readPointer("gSaveBlock2")
-    if not ptr then
-        return nil, err
+    -- Read pointers (refreshes SaveBlock1 as well)
+    local errors = refillSaveBlocks()
+    if not cache.saveBlock2 then
+        return nil, errors.gSaveBlock2
     end
     
-    -- Create SaveBlock2 structure
-    local saveBlock2 = {
-        pointer = ptr,
-        encryptionKey = ptr + Pointers.saveBlock2Offsets.encryptionKey,
-        pokedexOwned = ptr + Pointers.saveBlock2Offsets.pokedexOwned,
-        pokedexSeen = ptr + Pointers.saveBlock2Offsets.pokedexSeen
-    }
-    
-    -- Update cache
-    cache.saveBlock2 = saveBlock2
-    cache.lastCacheTime = currentFrame
-    
-    return saveBlock2
+    return cache.saveBlock2
 end
 
 -- Clear cache (useful when game state changes significantly)
 function Pointers.clearCache()
     cache.saveBlock1 = nil
     cache.saveBlock2 = nil
-    cache.lastCacheTime = 0
+    partyBase = nil
 end
 
 -- Get party address (FIXED FOR YOUR PATCHED ROM)
@@ -272,19 +344,24 @@ function Pointers.searchForParty()
     }
     
     for _, area in ipairs(searchAreas) do
-        for addr = area.start, area.start + area.size - 4, 4 do
-            local count = Memory.read_u32_le(addr)
-            
-            -- Look for valid party count
-            if count and count >= 1 and count <= 6 then
-                -- Verify it looks like Pokemon data
-                local personality = Memory.read_u32_le(addr + 4)
-                if personality and personality > 0 and personality < 0xFFFFFFFF then
-                    local hp = Memory.read_u16_le(addr + 4 + 86)
-                    local maxHp = Memory.read_u16_le(addr + 4 + 88)
-                    
-                    if hp and maxHp and hp <= maxHp and maxHp > 0 and maxHp < 1000 then
-                        return addr  -- Found it!
+        -- One bulk read per area (padded so the last candidate's HP words are included);
+        -- the Pokemon checks only run where the count test passes
+        local bytes = Memory.readbyterange(area.start, area.size + 92)
+        if bytes then
+            for o = 0, area.size - 4, 4 do
+                local count = bytes[o]
+                
+                -- Look for valid party count
+                if count >= 1 and count <= 6 and bytes[o + 1] == 0 and bytes[o + 2] == 0 and bytes[o + 3] == 0 then
+                    -- Verify it looks like Pokemon data
+                    local personality = bytes[o + 4] + bytes[o + 5] * 0x100 + bytes[o + 6] * 0x10000 + bytes[o + 7] * 0x1000000
+                    if personality > 0 and personality < 0xFFFFFFFF then
+                        local hp = bytes[o + 90] + bytes[o + 91] * 0x100
+                        local maxHp = bytes[o + 92] + bytes[o + 93] * 0x100
+                        
+                        if hp <= maxHp and maxHp > 0 and maxHp < 1000 then
+                            return area.start + o  -- Found it!
+                        end
                     end
                 end
             end
@@ -309,19 +386,49 @@ function Pointers.getPartyCount()
     return count
 end
 
+-- True while getPartyAddress would still pick the cached address: SaveBlock1 has not
+-- moved, and the party count it was chosen by still checks out
+local function partyBaseValid()
+    if not partyBase or Memory.read_u32_le(Pointers.addresses.gSaveBlock1) ~= partyBasePtr then
+        return false
+    end
+    
+    -- The hardcoded address wins whenever it holds a valid count
+    local hardcodedCount = Memory.read_u32_le(PARTY_ADDRESS)
+    local hardcodedValid = hardcodedCount ~= nil and hardcodedCount >= 1 and hardcodedCount <= 6
+    if partyBase == PARTY_ADDRESS then
+        return hardcodedValid
+    elseif hardcodedValid then
+        return false  -- The hardcoded party is back, so switch to it
+    end
+    
+    local count = Memory.read_u32_le(partyBase)
+    return count ~= nil and count <= 6
+end
+
+-- Re-resolve the cached party address
+function Pointers.refreshPartyBase()
+    partyBase = Pointers.getPartyAddress()
+    partyBasePtr = Memory.read_u32_le(Pointers.addresses.gSaveBlock1) or 0
+    return partyBase
+end
+
 -- Get Pokemon address in party
 function Pointers.getPartyPokemonAddress(slot)
-    if slot < 0 or slot > 5 then
-        return nil, "Invalid slot: " .. slot
+    local offset = SLOT_OFFSETS[slot]
+    if not offset then
+        return nil, "Invalid slot: " .. tostring(slot)
     end
     
-    local partyAddr = Pointers.getPartyAddress()
-    if not partyAddr then
+    -- Re-resolve the party when DMA has moved SaveBlock1 or the cached base went stale
+    if not partyBaseValid() then
+        Pointers.refreshPartyBase()
+    end
+    if not partyBase then
         return nil, "Failed to get party address"
     end
     
-    -- Each Pokemon is 100 bytes
-    return partyAddr + 4 + (slot * 100)
+    return partyBase + offset
 end
 
 -- Get PC box address
@@ -389,9 +496,10 @@ function Pointers.test()
     -- Test reading main pointers
     console.log("Main pointers:")
     local mainPointers = {"gSaveBlock1", "gSaveBlock2", "gMain", "gPlayerParty"}
+    local pointers, errors = Pointers.readPointersBulk(mainPointers)
     
     for _, name in ipairs(mainPointers) do
-        local ptr, err = Pointers.readPointer(name)
+        local ptr, err = pointers[name], errors[name]
         if ptr then
             console.log(string.format("✓ %s: 0x%08X", name, ptr))
         else
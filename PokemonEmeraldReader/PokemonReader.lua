@@ -28,6 +28,15 @@ PokemonReader.SUBSTRUCTURE_ORDERS = {
     {3, 0, 1, 2}, {3, 0, 2, 1}, {3, 1, 0, 2}, {3, 1, 2, 0}, {3, 2, 0, 1}, {3, 2, 1, 0}
 }
 
+-- Little-endian reads from a 0-indexed byte table
+local function u16(bytes, off)
+    return bytes[off] + bytes[off + 1] * 0x100
+end
+
+local function u32(bytes, off)
+    return bytes[off] + bytes[off + 1] * 0x100 + bytes[off + 2] * 0x10000 + bytes[off + 3] * 0x1000000
+end
+
 -- Substructure types
 local GROWTH = 0
 local ATTACKS = 1
@@ -61,42 +70,48 @@ function PokemonReader.readPokemon(address, isInPC)
         ROMData.init()
     end
     
+    -- One bulk read for the whole structure
+    local size = isInPC and PokemonReader.POKEMON_PC_SIZE or PokemonReader.POKEMON_SIZE
+    local bytes = Memory.readbyterange(address, size)
+    if not bytes then
+        return nil
+    end
+    
+    return PokemonReader.readPokemonFromBytes(bytes, 0, isInPC)
+end
+
+-- Decrypt and decode a Pokemon from a 0-indexed byte table starting at base
+function PokemonReader.readPokemonFromBytes(bytes, base, isInPC)
     local pokemon = {}
     
-    -- Read unencrypted header (32 bytes)
-    pokemon.personality = Memory.read_u32_le(address + 0)
-    pokemon.otId = Memory.read_u32_le(address + 4)
-    pokemon.nickname = PokemonReader.readPokemonString(address + 8, 10)
-    pokemon.language = Memory.read_u16_le(address + 18)
-    pokemon.otName = PokemonReader.readPokemonString(address + 20, 7)
-    pokemon.markings = Memory.read_u8(address + 27)
-    pokemon.checksum = Memory.read_u16_le(address + 28)
+    -- Unencrypted header (32 bytes)
+    pokemon.personality = u32(bytes, base + 0)
+    pokemon.otId = u32(bytes, base + 4)
+    pokemon.nickname = PokemonReader.decodeString(bytes, base + 8, 10)
+    pokemon.language = u16(bytes, base + 18)
+    pokemon.otName = PokemonReader.decodeString(bytes, base + 20, 7)
+    pokemon.markings = bytes[base + 27]
+    pokemon.checksum = u16(bytes, base + 28)
     
     -- Validate basic data
-    if not pokemon.personality or pokemon.personality == 0 then
+    if pokemon.personality == 0 then
         return nil  -- Empty slot
     end
     
     -- Calculate encryption key
     local key = bxor(pokemon.personality, pokemon.otId)
     
-    -- Read encrypted data (48 bytes)
-    local encryptedData = Memory.readbytes(address + 32, 48)
-    if not encryptedData then
-        return nil
-    end
-    
     -- Determine substructure order
     local orderIndex = pokemon.personality % 24
     local order = PokemonReader.SUBSTRUCTURE_ORDERS[orderIndex + 1]
     
-    -- Decrypt each 12-byte substructure
+    -- Decrypt each 12-byte substructure (encrypted data starts at byte 32)
     local substructures = {}
     for i = 0, 3 do
-        local offset = i * 12 + 1
+        local offset = base + 32 + i * 12
         local subData = {}
         for j = 0, 11 do
-            subData[j + 1] = encryptedData[offset + j]
+            subData[j + 1] = bytes[offset + j]
         end
         local decrypted = PokemonReader.decryptSubstructure(subData, key)
         local subType = order[i + 1]
@@ -196,19 +211,23 @@ function PokemonReader.readPokemon(address, isInPC)
     
     -- Read battle stats (unencrypted, only for party Pokemon)
     if not isInPC then
-        local battleStatsAddr = address + 80
+        local stats = base + 80
         pokemon.battleStats = {
-            status = Memory.read_u32_le(battleStatsAddr + 0),
-            level = Memory.read_u8(battleStatsAddr + 4),
-            pokerusRemaining = Memory.read_u8(battleStatsAddr + 5),
-            currentHP = Memory.read_u16_le(battleStatsAddr + 6),
-            maxHP = Memory.read_u16_le(battleStatsAddr + 8),
-            attack = Memory.read_u16_le(battleStatsAddr + 10),
-            defense = Memory.read_u16_le(battleStatsAddr + 12),
-            speed = Memory.read_u16_le(battleStatsAddr + 14),
-            spAttack = Memory.read_u16_le(battleStatsAddr + 16),
-            spDefense = Memory.read_u16_le(battleStatsAddr + 18),
+            status = u32(bytes, stats + 0),
+            level = bytes[stats + 4],
+            pokerusRemaining = bytes[stats + 5],
+            currentHP = u16(bytes, stats + 6),
+            maxHP = u16(bytes, stats + 8),
+            attack = u16(bytes, stats + 10),
+            defense = u16(bytes, stats + 12),
+            speed = u16(bytes, stats + 14),
+            spAttack = u16(bytes, stats + 16),
+            spDefense = u16(bytes, stats + 18),
         }
+        
+        -- Positional copy for display passes: maxHP, ATK, DEF, SPE, SPA, SPD
+        local b = pokemon.battleStats
+        pokemon.stats = {b.maxHP, b.attack, b.defense, b.speed, b.spAttack, b.spDefense}
     end
     
     -- Get ROM data for the species
@@ -219,6 +238,17 @@ function PokemonReader.readPokemon(address, isInPC)
     -- Calculate nature from personality
     pokemon.nature = pokemon.personality % 25
     
+    -- Resolve display names once (they don't change after decode)
+    local baseData = pokemon.baseData
+    if baseData then
+        pokemon.type1Name = ROMData.getTypeName(baseData.type1) or "???"
+        pokemon.type2Name = ROMData.getTypeName(baseData.type2) or "???"
+        if pokemon.abilityBit then
+            pokemon.ability = pokemon.abilityBit == 0 and baseData.ability1 or baseData.ability2
+            pokemon.abilityName = ROMData.getAbilityName(pokemon.ability) or "???"
+        end
+    end
+    
     return pokemon
 end
 
@@ -227,53 +257,97 @@ function PokemonReader.readParty()
     local partyAddr = Pointers.getPartyAddress()
     if not partyAddr then return nil end
     
+    -- Full records in pokemon, plus per-slot columns of the hot display fields
+    -- Count and all six slots in one bulk read
+    local bytes = Memory.readbyterange(partyAddr, 4 + PokemonReader.PARTY_SIZE * PokemonReader.POKEMON_SIZE)
+    if not bytes then return nil end
+    
+    if not ROMData.data.initialized then
+        ROMData.init()
+    end
+    
     local party = {
-        count = Memory.read_u32_le(partyAddr),
-        pokemon = {}
+        count = u32(bytes, 0),
+        pokemon = {},
+        species = {},
+        level = {},
+        currentHP = {},
+        maxHP = {}
     }
     
     -- Validate party count
-    if not party.count or party.count > 6 then
+    if party.count > 6 then
         party.count = 0
         return party
     end
     
     -- Read each Pokemon
     for i = 0, party.count - 1 do
-        local pokemonAddr = partyAddr + 4 + (i * PokemonReader.POKEMON_SIZE)
-        party.pokemon[i + 1] = PokemonReader.readPokemon(pokemonAddr, false)
+        local pokemon = PokemonReader.readPokemonFromBytes(bytes, 4 + i * PokemonReader.POKEMON_SIZE, false)
+        local stats = pokemon and pokemon.battleStats
+        party.pokemon[i + 1] = pokemon
+        party.species[i + 1] = pokemon and pokemon.species or 0
+        party.level[i + 1] = stats and stats.level or 0
+        party.currentHP[i + 1] = stats and stats.currentHP or 0
+        party.maxHP[i + 1] = stats and stats.maxHP or 0
     end
     
     return party
 end
 
+-- Raw party block (count + 6 Pokemon) as a string, compared exactly to detect changes
+-- Returns nil if the block can't be read
+function PokemonReader.partySnapshot()
+    local partyAddr = Pointers.getPartyAddress()
+    if not partyAddr then return nil end
+    
+    local length = 4 + PokemonReader.PARTY_SIZE * PokemonReader.POKEMON_SIZE
+    local bytes = Memory.readbyterange(partyAddr, length)
+    if not bytes then return nil end
+    
+    return string.char((table.unpack or unpack)(bytes, 0, length - 1))
+end
+
 -- Read Pokemon string (Gen 3 encoding)
 function PokemonReader.readPokemonString(address, maxLength)
-    local str = ""
-    for i = 0, maxLength - 1 do
-        local char = Memory.read_u8(address + i)
+    local bytes = Memory.readbyterange(address, maxLength)
+    if not bytes then return "" end
+    return PokemonReader.decodeString(bytes, 0, maxLength)
+end
+
+-- Decode a Gen 3 string from a 0-indexed byte table
+function PokemonReader.decodeString(bytes, offset, maxLength)
+    local buf, n = {}, 0
+    for i = offset, offset + maxLength - 1 do
+        local char = bytes[i]
         if not char or char == 0xFF then break end
         
         -- Character mapping
+        local piece
         if char == 0x00 then
-            str = str .. " "
+            piece = " "
         elseif char >= 0xBB and char <= 0xD4 then
-            str = str .. string.char(char - 0xBB + 65)  -- A-Z
+            piece = string.char(char - 0xBB + 65)  -- A-Z
         elseif char >= 0xD5 and char <= 0xEE then
-            str = str .. string.char(char - 0xD5 + 97)  -- a-z
+            piece = string.char(char - 0xD5 + 97)  -- a-z
         elseif char >= 0xA1 and char <= 0xAA then
-            str = str .. string.char(char - 0xA1 + 48)  -- 0-9
+            piece = string.char(char - 0xA1 + 48)  -- 0-9
         elseif char == 0xAE then
-            str = str .. "-"
+            piece = "-"
         elseif char == 0xAF then
-            str = str .. "."
+            piece = "."
         elseif char == 0xBA then
-            str = str .. "!"
+            piece = "!"
         elseif char == 0xBF then
-            str = str .. "?"
+            piece = "?"
+        end
+        
+        if piece then
+            n = n + 1
+            buf[n] = piece
         end
     end
-    return str
+    return table.concat(buf, "", 1, n)
 end
 
 -- Format Pokemon info for display
@@ -320,23 +394,17 @@ function PokemonReader.formatPokemon(pokemon)
     end
     
     -- Types
-    if pokemon.baseData then
-        info.types = ROMData.getTypeName(pokemon.baseData.type1) or "???"
+    if pokemon.type1Name then
+        info.types = pokemon.type1Name
         if pokemon.baseData.type1 ~= pokemon.baseData.type2 then
-            info.types = info.types .. "/" .. (ROMData.getTypeName(pokemon.baseData.type2) or "???")
+            info.types = info.types .. "/" .. pokemon.type2Name
         end
     else
         info.types = "???/???"
     end
     
     -- Ability
-    if pokemon.baseData and pokemon.abilityBit then
-        local abilityId = pokemon.abilityBit == 0 and pokemon.baseData.ability1 or pokemon.baseData.ability2
-        local abilityData = ROMData.getAbility(abilityId)
-        info.ability = abilityData and abilityData.name or "???"
-    else
-        info.ability = "???"
-    end
+    info.ability = pokemon.abilityName or "???"
     
     -- Nature
     local natureData = ROMData.getNature(pokemon.nature)
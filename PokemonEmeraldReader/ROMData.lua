@@ -6,13 +6,23 @@ local Memory = require("Memory")
 
 local ROMData = {}
 
--- Bitwise operation compatibility
-local band = _VERSION >= "Lua 5.3" and function(a,b) return a & b end or bit.band
-local bor = _VERSION >= "Lua 5.3" and function(a,b) return a | b end or bit.bor
-local bxor = _VERSION >= "Lua 5.3" and function(a,b) return a ~ b end or bit.bxor
-local bnot = _VERSION >= "Lua 5.3" and function(a) return ~a end or bit.bnot
-local lshift = _VERSION >= "Lua 5.3" and function(a,b) return a << b end or bit.lshift
-local rshift = _VERSION >= "Lua 5.3" and function(a,b) return a >> b end or bit.rshift
+-- Bitwise operation compatibility (only band is used here; picked once at load)
+local band
+if _VERSION >= "Lua 5.3" then
+    band = assert(load("return function(a,b) return a & b end"))()
+else
+    band = bit.band
+end
+
+-- Little-endian decoders over a 0-indexed byte table from Memory.readbyterange
+local function u16(bytes, off)
+    return bytes[off] + bytes[off + 1] * 0x100
+end
+
+local function s8(bytes, off)
+    local value = bytes[off]
+    return value >= 0x80 and value - 0x100 or value
+end
 
 -- ROM addresses for Pokemon Emerald (UPDATED WITH YOUR FOUND ADDRESSES)
 ROMData.addresses = {
@@ -249,6 +259,26 @@ ROMData.data = {
     patchInfo = nil
 }
 
+-- Tables that are only built on first access (after init)
+local LAZY_LOADERS = {
+    moves = "loadMoveData",
+    items = "loadItemData",
+    abilities = "loadAbilityNames",
+    natures = "loadNatureData",
+    types = "loadTypeNames"
+}
+
+setmetatable(ROMData.data, {
+    __index = function(data, key)
+        local loader = LAZY_LOADERS[key]
+        if not loader or not rawget(data, "initialized") then return nil end
+        
+        local value = ROMData[loader]()
+        rawset(data, key, value)
+        return value
+    end
+})
+
 -- Initialize all ROM data
 function ROMData.init()
     if ROMData.data.initialized then
@@ -265,14 +295,10 @@ function ROMData.init()
         console.log("✓ Detected " .. ROMData.data.patchInfo.type .. " patch")
     end
     
-    -- Load static data
+    -- Load static data (moves, items, abilities, natures and types load on first use)
     ROMData.data.pokemon = ROMData.loadPokemonData()
-    ROMData.data.moves = ROMData.loadMoveData()
-    ROMData.data.items = ROMData.loadItemData()
-    ROMData.data.abilities = ROMData.loadAbilityNames()
-    ROMData.data.natures = ROMData.loadNatureData()
-    ROMData.data.types = ROMData.loadTypeNames()
     ROMData.data.typeChart = ROMData.loadTypeChart()
+    ROMData.data.typeDefenseScore = ROMData.buildTypeDefenseScores()
     
     ROMData.data.initialized = true
     console.log("ROM data initialized successfully")
@@ -294,10 +320,10 @@ function ROMData.getPokemonName(speciesId)
     end
     
     -- Try ROM data first
-    if ROMData.data.initialized and ROMData.data.pokemon and ROMData.data.pokemon[speciesId] then
-        local pokemon = ROMData.data.pokemon[speciesId]
-        if pokemon.name and pokemon.name ~= "" and not pokemon.name:match("^%s*$") then
-            return pokemon.name
+    if ROMData.data.initialized and ROMData.data.pokemon then
+        local name = ROMData.data.pokemon.name[speciesId]
+        if name and name ~= "" and not name:match("^%s*$") then
+            return name
         end
     end
     
@@ -400,6 +426,19 @@ function ROMData.getNatureName(natureId)
 end
 
 -- Enhanced item getter (fixes "Unknown" items)
+-- Item names decoded so far (items are decoded on first lookup, not at init)
+local itemNameCache = {}
+
+-- Decode an item's ROM name once and remember it
+local function readItemName(itemId)
+    local name = itemNameCache[itemId]
+    if not name then
+        name = ROMData.readPokemonString(ROMData.addresses.itemData + itemId * 44, 14)
+        itemNameCache[itemId] = name
+    end
+    return name
+end
+
 function ROMData.getItemName(itemId)
     if not itemId or itemId <= 0 then
         return "None"
@@ -407,18 +446,29 @@ function ROMData.getItemName(itemId)
     
     -- Try ROM data first for items (since we don't have comprehensive item fallbacks)
     if ROMData.data.initialized and ROMData.data.items and ROMData.data.items[itemId] then
-        local item = ROMData.data.items[itemId]
-        if item and item.name and item.name ~= "" then
-            return item.name
+        local name = readItemName(itemId)
+        if name ~= "" then
+            return name
         end
     end
     
     return "Item #" .. itemId
 end
 
+-- Per-species columns of ROMData.data.pokemon (parallel arrays indexed by species id)
+ROMData.pokemonFields = {
+    "hp", "attack", "defense", "speed", "spAttack", "spDefense", "bst",
+    "type1", "type2", "catchRate", "expYield", "evYield", "item1", "item2",
+    "genderRatio", "eggCycles", "baseFriendship", "growthRate", "eggGroup1", "eggGroup2",
+    "ability1", "ability2", "safariRate", "color", "name"
+}
+
 -- Load Pokemon base stats and data
 function ROMData.loadPokemonData()
-    local data = {}
+    local data = {record = {}}  -- record filled lazily by getPokemon
+    for _, field in ipairs(ROMData.pokemonFields) do
+        data[field] = {}
+    end
     local baseAddr = ROMData.addresses.pokemonStats
     
     if not baseAddr then
@@ -428,87 +478,111 @@ function ROMData.loadPokemonData()
     
     console.log("✓ Loaded patched ROM memory map")
     
-    -- Load base stats for all 411 Pokemon (including ???/Egg)
-    for i = 0, 410 do
-        local addr = baseAddr + (i * 28)  -- Each Pokemon is 28 bytes
-        
-        local pokemon = {
-            -- Stats
-            stats = {
-                hp = Memory.read_u8(addr + 0),
-                attack = Memory.read_u8(addr + 1),
-                defense = Memory.read_u8(addr + 2),
-                speed = Memory.read_u8(addr + 3),
-                spAttack = Memory.read_u8(addr + 4),
-                spDefense = Memory.read_u8(addr + 5)
-            },
-            
-            -- Type
-            type1 = Memory.read_u8(addr + 6),
-            type2 = Memory.read_u8(addr + 7),
-            
-            -- Misc data
-            catchRate = Memory.read_u8(addr + 8),
-            expYield = Memory.read_u8(addr + 9),
-            evYield = Memory.read_u16_le(addr + 10),
-            
-            -- Held items
-            item1 = Memory.read_u16_le(addr + 12),
-            item2 = Memory.read_u16_le(addr + 14),
-            
-            -- Gender ratio (0 = always male, 254 = always female, 255 = genderless)
-            genderRatio = Memory.read_u8(addr + 16),
-            
-            -- Breeding
-            eggCycles = Memory.read_u8(addr + 17),
-            baseFriendship = Memory.read_u8(addr + 18),
-            growthRate = Memory.read_u8(addr + 19),
-            eggGroup1 = Memory.read_u8(addr + 20),
-            eggGroup2 = Memory.read_u8(addr + 21),
-            
-            -- Abilities
-            ability1 = Memory.read_u8(addr + 22),
-            ability2 = Memory.read_u8(addr + 23),
-            
-            -- Safari Zone
-            safariRate = Memory.read_u8(addr + 24),
-            
-            -- Pokedex color
-            color = Memory.read_u8(addr + 25),
-            
-            -- Use enhanced name getter (with fallback)
-            name = ROMData.getPokemonName(i)
-        }
-        
-        -- Calculate base stat total
-        if pokemon.stats.hp then
-            pokemon.bst = pokemon.stats.hp + pokemon.stats.attack + pokemon.stats.defense +
-                         pokemon.stats.speed + pokemon.stats.spAttack + pokemon.stats.spDefense
-        else
-            pokemon.bst = 0
-        end
-        
-        data[i] = pokemon
+    -- Pull the whole base stats table (411 Pokemon x 28 bytes) in one read
+    local bytes = Memory.readbyterange(baseAddr, 411 * 28)
+    if not bytes then
+        console.log("⚠ Failed to read Pokemon stats table")
+        return data
     end
     
     -- Try to load Pokemon names from ROM (may fail for patched ROMs)
+    local names
     if ROMData.addresses.pokemonNames then
         console.log("✓ Loading Pokemon names from ROM")
-        local nameAddr = ROMData.addresses.pokemonNames
-        for i = 0, 410 do
-            local name = ROMData.readPokemonString(nameAddr + (i * 11), 11)
-            if data[i] and name and name ~= "" then
-                data[i].name = name
-            end
-        end
+        names = Memory.readbyterange(ROMData.addresses.pokemonNames, 411 * 11)
     else
         console.log("⚠ Pokemon names address not found")
         console.log("Using loaded patched addresses")
     end
     
+    local hp, attack, defense = data.hp, data.attack, data.defense
+    local speed, spAttack, spDefense = data.speed, data.spAttack, data.spDefense
+    
+    -- Decode base stats for all 411 Pokemon (including ???/Egg)
+    for i = 0, 410 do
+        local off = i * 28  -- Each Pokemon is 28 bytes
+        
+        -- Stats
+        hp[i] = bytes[off + 0]
+        attack[i] = bytes[off + 1]
+        defense[i] = bytes[off + 2]
+        speed[i] = bytes[off + 3]
+        spAttack[i] = bytes[off + 4]
+        spDefense[i] = bytes[off + 5]
+        
+        -- Calculate base stat total
+        data.bst[i] = hp[i] + attack[i] + defense[i] + speed[i] + spAttack[i] + spDefense[i]
+        
+        -- Type
+        data.type1[i] = bytes[off + 6]
+        data.type2[i] = bytes[off + 7]
+        
+        -- Misc data
+        data.catchRate[i] = bytes[off + 8]
+        data.expYield[i] = bytes[off + 9]
+        data.evYield[i] = u16(bytes, off + 10)
+        
+        -- Held items
+        data.item1[i] = u16(bytes, off + 12)
+        data.item2[i] = u16(bytes, off + 14)
+        
+        -- Gender ratio (0 = always male, 254 = always female, 255 = genderless)
+        data.genderRatio[i] = bytes[off + 16]
+        
+        -- Breeding
+        data.eggCycles[i] = bytes[off + 17]
+        data.baseFriendship[i] = bytes[off + 18]
+        data.growthRate[i] = bytes[off + 19]
+        data.eggGroup1[i] = bytes[off + 20]
+        data.eggGroup2[i] = bytes[off + 21]
+        
+        -- Abilities
+        data.ability1[i] = bytes[off + 22]
+        data.ability2[i] = bytes[off + 23]
+        
+        -- Safari Zone
+        data.safariRate[i] = bytes[off + 24]
+        
+        -- Pokedex color
+        data.color[i] = bytes[off + 25]
+        
+        -- ROM name if present, else enhanced name getter (with fallback)
+        local name = names and ROMData.decodePokemonString(names, i * 11, 11)
+        if not name or name == "" then
+            name = ROMData.getPokemonName(i)
+        end
+        data.name[i] = name
+    end
+    
     return data
 end
 
+-- Move flag bits, exposed as move.makesContact etc. without storing a boolean per move
+local MOVE_FLAGS = {
+    makesContact = 0x01,
+    isProtectable = 0x02,
+    isMagicCoatAffected = 0x04,
+    isSnatchable = 0x08,
+    canMetronome = 0x10,
+    cannotSketch = 0x20
+}
+
+local MoveMeta = {
+    __index = function(move, key)
+        local mask = MOVE_FLAGS[key]
+        if mask then
+            return band(move.flags, mask) ~= 0
+        end
+    end
+}
+
+-- Check one move flag by name (e.g. "makesContact")
+function ROMData.moveHasFlag(moveId, flag)
+    local move = ROMData.data.moves and ROMData.data.moves[moveId]
+    local mask = MOVE_FLAGS[flag]
+    return move and mask and band(move.flags, mask) ~= 0 or false
+end
+
 -- Load move data
 function ROMData.loadMoveData()
     local data = {}
@@ -519,52 +593,49 @@ function ROMData.loadMoveData()
         return data
     end
     
-    -- Load data for all 355 moves
+    -- Pull the whole move table (355 moves x 12 bytes) in one read
+    local bytes = Memory.readbyterange(baseAddr, 355 * 12)
+    if not bytes then
+        console.log("⚠ Failed to read move data table")
+        return data
+    end
+    
+    -- Try to load move names from ROM (may fail for patched ROMs)
+    local names
+    if ROMData.addresses.moveNames then
+        console.log("✓ Loading move names from ROM")
+        names = Memory.readbyterange(ROMData.addresses.moveNames, 355 * 13)
+    else
+        console.log("⚠ Move names address not found")
+    end
+    
+    -- Decode data for all 355 moves
     for i = 0, 354 do
-        local addr = baseAddr + (i * 12)  -- Each move is 12 bytes
+        local off = i * 12  -- Each move is 12 bytes
         
         local move = {
-            effect = Memory.read_u8(addr + 0),
-            power = Memory.read_u8(addr + 1),
-            type = Memory.read_u8(addr + 2),
-            accuracy = Memory.read_u8(addr + 3),
-            pp = Memory.read_u8(addr + 4),
-            effectChance = Memory.read_u8(addr + 5),
-            target = Memory.read_u8(addr + 6),
-            priority = Memory.read_s8(addr + 7),  -- Signed
-            flags = Memory.read_u8(addr + 8),
-            argument = Memory.read_u8(addr + 9),
+            effect = bytes[off + 0],
+            power = bytes[off + 1],
+            type = bytes[off + 2],
+            accuracy = bytes[off + 3],
+            pp = bytes[off + 4],
+            effectChance = bytes[off + 5],
+            target = bytes[off + 6],
+            priority = s8(bytes, off + 7),  -- Signed
+            flags = bytes[off + 8],
+            argument = bytes[off + 9]
             -- Padding: 2 bytes
-            
-            -- Use enhanced name getter (with fallback)
-            name = ROMData.getMoveName(i)
         }
         
-        -- Decode flags
-        if move.flags then
-            move.makesContact = band(move.flags, 0x01) ~= 0
-            move.isProtectable = band(move.flags, 0x02) ~= 0
-            move.isMagicCoatAffected = band(move.flags, 0x04) ~= 0
-            move.isSnatchable = band(move.flags, 0x08) ~= 0
-            move.canMetronome = band(move.flags, 0x10) ~= 0
-            move.cannotSketch = band(move.flags, 0x20) ~= 0
+        -- ROM name if present, else fallback name (getMoveName would re-enter this loader)
+        local name = names and ROMData.decodePokemonString(names, i * 13, 13)
+        if not name or name == "" then
+            name = ROMData.fallbackNames.moves[i] or "Move #" .. string.format("%03d", i)
         end
+        move.name = name
         
-        data[i] = move
-    end
-    
-    -- Try to load move names from ROM (may fail for patched ROMs)
-    if ROMData.addresses.moveNames then
-        console.log("✓ Loading move names from ROM")
-        local nameAddr = ROMData.addresses.moveNames
-        for i = 0, 354 do
-            local name = ROMData.readPokemonString(nameAddr + (i * 13), 13)
-            if data[i] and name and name ~= "" then
-                data[i].name = name
-            end
-        end
-    else
-        console.log("⚠ Move names address not found")
+        -- Flag booleans are decoded from move.flags on access
+        data[i] = setmetatable(move, MoveMeta)
     end
     
     return data
@@ -580,24 +651,29 @@ function ROMData.loadItemData()
         return data
     end
     
-    -- Load data for items (up to 377 in Emerald)
+    -- Pull the whole item table (377 items x 44 bytes) in one read
+    local bytes = Memory.readbyterange(baseAddr, 377 * 44)
+    if not bytes then
+        console.log("✗ Failed to read item data table")
+        return data
+    end
+    
+    -- Names are decoded lazily by ROMData.getItemName
+    itemNameCache = {}
+    
+    -- Decode data for items (up to 377 in Emerald)
     for i = 0, 376 do
-        local addr = baseAddr + (i * 44)  -- Each item is 44 bytes
+        local off = i * 44  -- Each item is 44 bytes
         
         local item = {
-            name = ROMData.readPokemonString(addr + 0, 14),
-            index = Memory.read_u16_le(addr + 14),
-            price = Memory.read_u16_le(addr + 16),
-            holdEffect = Memory.read_u8(addr + 18),
-            parameter = Memory.read_u8(addr + 19),
-            description = Memory.read_u32_le(addr + 20),  -- Pointer to description
-            mysteryValue = Memory.read_u16_le(addr + 24),
-            pocket = Memory.read_u8(addr + 26),
-            type = Memory.read_u8(addr + 27),
-            fieldEffect = Memory.read_u32_le(addr + 28),  -- Pointer
-            battleUsage = Memory.read_u32_le(addr + 32),  -- Pointer
-            battleEffect = Memory.read_u32_le(addr + 36), -- Pointer
-            extraParameter = Memory.read_u32_le(addr + 40) -- Pointer
+            index = u16(bytes, off + 14),
+            price = u16(bytes, off + 16),
+            holdEffect = bytes[off + 18],
+            parameter = bytes[off + 19],
+            -- Pointer fields are read on demand (ROMData.getItemPointer)
+            mysteryValue = u16(bytes, off + 24),
+            pocket = bytes[off + 26],
+            type = bytes[off + 27]
         }
         
         data[i] = item
@@ -606,6 +682,25 @@ function ROMData.loadItemData()
     return data
 end
 
+-- Offsets of the ROM pointer fields inside a 44-byte item entry
+local ITEM_POINTER_OFFSETS = {
+    description = 20,
+    fieldEffect = 28,
+    battleUsage = 32,
+    battleEffect = 36,
+    extraParameter = 40
+}
+
+-- Read one item pointer field (e.g. "description", "fieldEffect") from ROM
+function ROMData.getItemPointer(itemId, field)
+    local baseAddr = ROMData.addresses.itemData
+    local offset = ITEM_POINTER_OFFSETS[field]
+    if not baseAddr or not offset or not itemId or itemId < 0 or itemId > 376 then
+        return nil
+    end
+    return Memory.read_u32_le(baseAddr + itemId * 44 + offset)
+end
+
 -- Load ability names
 function ROMData.loadAbilityNames()
     local data = {}
@@ -616,10 +711,14 @@ function ROMData.loadAbilityNames()
         return data
     end
     
-    -- Load 78 abilities (0-77)
+    -- Load 78 abilities (0-77) from a single read
+    local bytes = Memory.readbyterange(baseAddr, 78 * 13)
+    if not bytes then
+        return data
+    end
+    
     for i = 0, 77 do
-        local name = ROMData.readPokemonString(baseAddr + (i * 13), 13)
-        data[i] = name
+        data[i] = ROMData.decodePokemonString(bytes, i * 13, 13)
     end
     
     return data
@@ -644,12 +743,23 @@ function ROMData.loadNatureData()
         [5] = {[1] = 16, [2] = 17, [3] = 18, [4] = 19}  -- Sp.Def+
     }
     
+    -- Invert once: nature index -> affected stats
+    local natureByIndex = {}
+    for inc, row in pairs(natureModifiers) do
+        for dec, index in pairs(row) do
+            natureByIndex[index] = {inc = inc, dec = dec}
+        end
+    end
+    
+    -- Read all 25 nature names at once
+    local names = nameAddr and Memory.readbyterange(nameAddr, 25 * 7)
+    
     -- Load 25 natures
     for i = 0, 24 do
         local name = "Unknown"
         
-        if nameAddr then
-            name = ROMData.readPokemonString(nameAddr + (i * 7), 7)
+        if names then
+            name = ROMData.decodePokemonString(names, i * 7, 7)
         end
         
         -- Use fallback if ROM name is empty
@@ -657,25 +767,13 @@ function ROMData.loadNatureData()
             name = ROMData.fallbackNames.natures[i] or "Nature #" .. i
         end
         
-        -- Calculate stat modifiers
-        local increased = nil
-        local decreased = nil
-        
-        -- Find which stats are affected
-        for inc = 1, 5 do
-            for dec = 1, 5 do
-                if natureModifiers[inc] and natureModifiers[inc][dec] == i then
-                    increased = inc
-                    decreased = dec
-                    break
-                end
-            end
-        end
+        -- Stat modifiers (neutral natures have none)
+        local modifier = natureByIndex[i]
         
         data[i] = {
             name = name,
-            increased = increased,  -- 1=Atk, 2=Def, 3=Spe, 4=SpA, 5=SpD
-            decreased = decreased   -- Same indices
+            increased = modifier and modifier.inc,  -- 1=Atk, 2=Def, 3=Spe, 4=SpA, 5=SpD
+            decreased = modifier and modifier.dec   -- Same indices
         }
     end
     
@@ -692,18 +790,38 @@ function ROMData.loadTypeNames()
         return data
     end
     
-    -- Load 18 types (includes ???)
+    -- Load 18 types (includes ???) from a single read
+    local bytes = Memory.readbyterange(baseAddr, 18 * 7)
+    if not bytes then
+        return data
+    end
+    
     for i = 0, 17 do
-        local name = ROMData.readPokemonString(baseAddr + (i * 7), 7)
-        data[i] = name
+        data[i] = ROMData.decodePokemonString(bytes, i * 7, 7)
     end
     
     return data
 end
 
+-- Type chart is a flat array keyed by attacker * TYPE_STRIDE + defender
+local TYPE_COUNT = 18
+local TYPE_STRIDE = 32
+
+-- Look up one matchup; types outside the chart take normal damage
+local function chartEffectiveness(chart, attackType, defenseType)
+    if attackType and defenseType and attackType >= 0 and attackType < TYPE_COUNT and
+       defenseType >= 0 and defenseType < TYPE_STRIDE then
+        return chart[attackType * TYPE_STRIDE + defenseType]
+    end
+    return 10
+end
+
 -- Load type effectiveness chart
 function ROMData.loadTypeChart()
     local data = {}
+    for i = 0, TYPE_COUNT * TYPE_STRIDE - 1 do
+        data[i] = 10  -- Default to normal damage
+    end
     local baseAddr = ROMData.addresses.typeEffectiveness
     
     if not baseAddr then
@@ -711,12 +829,25 @@ function ROMData.loadTypeChart()
         return data
     end
     
-    -- Read type chart until terminator
+    -- Read type chart in 1 KB blocks and scan for the terminator in Lua
+    local BLOCK_SIZE = 0x400
+    local raw, blockStart
     local offset = 0
     while true do
-        local attacker = Memory.read_u8(baseAddr + offset)
-        local defender = Memory.read_u8(baseAddr + offset + 1)
-        local effectiveness = Memory.read_u8(baseAddr + offset + 2)
+        -- Refill once the next entry runs past the current block
+        if not raw or offset + 3 > blockStart + BLOCK_SIZE then
+            blockStart = offset
+            raw = Memory.readbyterange(baseAddr + blockStart, BLOCK_SIZE)
+            if not raw then
+                console.log("⚠ Failed to read type effectiveness chart")
+                break
+            end
+        end
+        
+        local pos = offset - blockStart
+        local attacker = raw[pos]
+        local defender = raw[pos + 1]
+        local effectiveness = raw[pos + 2]
         
         -- Terminator: 0xFE 0xFE 0x00
         if attacker == 0xFE and defender == 0xFE then
@@ -724,10 +855,9 @@ function ROMData.loadTypeChart()
         end
         
         -- Store effectiveness
-        if not data[attacker] then
-            data[attacker] = {}
+        if attacker < TYPE_COUNT and defender < TYPE_STRIDE then
+            data[attacker * TYPE_STRIDE + defender] = effectiveness
         end
-        data[attacker][defender] = effectiveness
         
         offset = offset + 3
     end
@@ -735,70 +865,71 @@ function ROMData.loadTypeChart()
     return data
 end
 
+-- Pokemon text encoding -> ASCII, built once from the basic character mapping (simplified)
+local CHARMAP = {[0x00] = " "}
+for char = 0xBB, 0xD4 do CHARMAP[char] = string.char(char - 0xBB + 65) end  -- A-Z
+for char = 0xD5, 0xEE do CHARMAP[char] = string.char(char - 0xD5 + 97) end  -- a-z
+for char = 0xA1, 0xAA do CHARMAP[char] = string.char(char - 0xA1 + 48) end  -- 0-9
+CHARMAP[0xAE] = "-"
+CHARMAP[0xAF] = "."
+CHARMAP[0xB0] = "..."   -- Ellipsis
+CHARMAP[0xB1] = "\""    -- Left double quote
+CHARMAP[0xB2] = "\""    -- Right double quote
+CHARMAP[0xB3] = "'"     -- Left single quote
+CHARMAP[0xB4] = "'"     -- Right single quote
+CHARMAP[0xB5] = "M"     -- Male symbol
+CHARMAP[0xB6] = "F"     -- Female symbol
+CHARMAP[0xBA] = "e"     -- e with accent
+
+-- Decode Pokemon text encoding from a 0-indexed byte table
+function ROMData.decodePokemonString(bytes, offset, maxLength)
+    local buf, n = {}, 0
+    for i = offset, offset + maxLength - 1 do
+        local char = bytes[i]
+        if not char or char == 0xFF then break end  -- Terminator
+        n = n + 1
+        buf[n] = CHARMAP[char] or ""
+    end
+    return table.concat(buf, "", 1, n)
+end
+
 -- Read Pokemon text encoding
 function ROMData.readPokemonString(addr, maxLength)
-    local str = ""
-    for i = 0, maxLength - 1 do
-        local char = Memory.read_u8(addr + i)
-        if char == 0xFF then break end  -- Terminator
-        
-        -- Basic character mapping (simplified)
-        if char == 0x00 then
-            str = str .. " "
-        elseif char >= 0xBB and char <= 0xD4 then
-            str = str .. string.char(char - 0xBB + 65)  -- A-Z
-        elseif char >= 0xD5 and char <= 0xEE then
-            str = str .. string.char(char - 0xD5 + 97)  -- a-z
-        elseif char >= 0xA1 and char <= 0xAA then
-            str = str .. string.char(char - 0xA1 + 48)  -- 0-9
-        elseif char == 0xAE then
-            str = str .. "-"
-        elseif char == 0xAF then
-            str = str .. "."
-        elseif char == 0xB0 then
-            str = str .. "..."  -- Ellipsis
-        elseif char == 0xB1 then
-            str = str .. "\""   -- Left double quote
-        elseif char == 0xB2 then
-            str = str .. "\""   -- Right double quote
-        elseif char == 0xB3 then
-            str = str .. "'"    -- Left single quote
-        elseif char == 0xB4 then
-            str = str .. "'"    -- Right single quote
-        elseif char == 0xB5 then
-            str = str .. "M"    -- Male symbol
-        elseif char == 0xB6 then
-            str = str .. "F"    -- Female symbol
-        elseif char == 0xBA then
-            str = str .. "e"    -- e with accent
-        end
+    local bytes = Memory.readbyterange(addr, maxLength)
+    if not bytes then
+        return ""
+    end
+    return ROMData.decodePokemonString(bytes, 0, maxLength)
+end
+
+-- Common patch signatures and locations (checked in order)
+local PATCH_SIGNATURES = {
+    {addr = 0x08F00000, name = "Archipelago", sig = "ARCH"},
+    {addr = 0x08E00000, name = "Randomizer", sig = "RAND"},
+    {addr = 0x08D00000, name = "Custom", sig = nil}
+}
+
+-- Each 4-byte signature as the little-endian word it reads back as
+for _, patch in ipairs(PATCH_SIGNATURES) do
+    if patch.sig then
+        local a, b, c, d = patch.sig:byte(1, 4)
+        patch.word = a + b * 0x100 + c * 0x10000 + d * 0x1000000
     end
-    return str
 end
 
 -- Detect ROM patches
 function ROMData.detectPatch()
-    local patches = {
-        -- Common patch signatures and locations
-        {addr = 0x08F00000, name = "Archipelago", sig = "ARCH"},
-        {addr = 0x08E00000, name = "Randomizer", sig = "RAND"},
-        {addr = 0x08D00000, name = "Custom", sig = nil}
-    }
-    
-    for _, patch in ipairs(patches) do
-        local data = Memory.readbytes(patch.addr, 16)
-        if data and data[1] ~= 0xFF then  -- Not empty ROM space
+    for _, patch in ipairs(PATCH_SIGNATURES) do
+        -- One word read covers both the empty-space test and the signature
+        local word = Memory.read_u32_le(patch.addr)
+        if word and word % 0x100 ~= 0xFF then  -- Not empty ROM space
             -- Check for signature if specified
             if patch.sig then
-                local sig = ""
-                for i = 1, #patch.sig do
-                    sig = sig .. string.char(data[i] or 0)
-                end
-                if sig == patch.sig then
+                if word == patch.word then
                     return {
                         type = patch.name,
                         address = patch.addr,
-                        signature = sig
+                        signature = patch.sig
                     }
                 end
             else
@@ -815,21 +946,124 @@ function ROMData.detectPatch()
     return nil
 end
 
+-- Forget cached Pokemon records (call after patching ROM data in place)
+function ROMData.clearRecordCache()
+    if ROMData.data.pokemon then
+        ROMData.data.pokemon.record = {}
+    end
+end
+
+-- Matchup categories packed as weaknesses * 65536 + resistances * 256 + immunities
+local function classifyEffectiveness(effectiveness)
+    if effectiveness > 10 then
+        return 65536
+    elseif effectiveness < 10 and effectiveness > 0 then
+        return 256
+    elseif effectiveness == 0 then
+        return 1
+    end
+    return 0
+end
+
+-- Packed categories for every multiplier the vanilla chart can produce
+local EFFECT_BUCKETS = {}
+for _, effectiveness in ipairs({0, 2.5, 5, 10, 20, 40}) do
+    EFFECT_BUCKETS[effectiveness] = classifyEffectiveness(effectiveness)
+end
+
+-- Score a defensive typing against the loaded type chart
+local function computeTypeDefensiveScore(type1, type2)
+    local packed = 0
+    
+    -- Hoist the chart and the defender bounds checks out of the attacker loop
+    local chart = ROMData.data.typeChart
+    local dual = type2 ~= type1
+    local inChart1 = type1 and type1 >= 0 and type1 < TYPE_STRIDE
+    local inChart2 = dual and type2 and type2 >= 0 and type2 < TYPE_STRIDE
+    
+    -- Check all type matchups
+    for atkType = 0, 17 do
+        local row = atkType * TYPE_STRIDE
+        
+        -- Check vs type1
+        local effectiveness = inChart1 and chart[row + type1] or 10
+        
+        -- Check vs type2 if different
+        if dual then
+            local eff2 = inChart2 and chart[row + type2] or 10
+            effectiveness = (effectiveness * eff2) / 10
+        end
+        
+        -- Table lookup instead of the compare chain (unusual randomizer values fall back)
+        packed = packed + (EFFECT_BUCKETS[effectiveness] or classifyEffectiveness(effectiveness))
+    end
+    
+    local weaknesses = math.floor(packed / 65536)
+    local resistances = math.floor(packed / 256) % 256
+    local immunities = packed % 256
+    
+    -- Score based on defensive profile (0.0 to 1.0)
+    return math.min(1.0, math.max(0.0, 0.5 + (resistances * 0.05) + (immunities * 0.1) - (weaknesses * 0.08)))
+end
+
+-- Precompute defensive scores for every type pair (call after the type chart is loaded)
+function ROMData.buildTypeDefenseScores()
+    local scores = {}
+    for type1 = 0, 17 do
+        scores[type1] = {}
+        for type2 = 0, 17 do
+            scores[type1][type2] = computeTypeDefensiveScore(type1, type2)
+        end
+    end
+    return scores
+end
+
+-- Calculate defensive type score
+function ROMData.calculateTypeDefensiveScore(type1, type2)
+    if not ROMData.data.initialized then return 0.5 end
+    
+    local row = ROMData.data.typeDefenseScore and ROMData.data.typeDefenseScore[type1]
+    local score = row and row[type2 or type1]
+    if score then
+        return score
+    end
+    
+    -- Types outside the standard 18 are scored directly
+    return computeTypeDefensiveScore(type1, type2)
+end
+
 -- MAIN GETTER FUNCTIONS (enhanced with fallbacks)
 
--- Get Pokemon with proper name
+-- Get Pokemon with proper name (builds the record view from the SoA columns,
+-- once per species; the returned table is shared, so treat it as read-only)
 function ROMData.getPokemon(species)
     if not ROMData.data.initialized then ROMData.init() end
-    local pokemon = ROMData.data.pokemon and ROMData.data.pokemon[species]
+    local data = ROMData.data.pokemon
+    if not data or not data.hp[species] then return nil end
     
-    -- Ensure the pokemon has a proper name
-    if pokemon then
-        pokemon.name = ROMData.getPokemonName(species)
+    local cached = data.record[species]
+    if cached then return cached end
+    
+    -- Stats stay inline (pokemon.hp, pokemon.attack, ...) like the columns
+    local pokemon = {}
+    for _, field in ipairs(ROMData.pokemonFields) do
+        pokemon[field] = data[field][species]
     end
     
+    -- Ensure the pokemon has a proper name
+    pokemon.name = ROMData.getPokemonName(species)
+    
+    data.record[species] = pokemon
     return pokemon
 end
 
+-- Get a single Pokemon field without building a record (e.g. "bst", "speed", "type1")
+function ROMData.getPokemonField(species, field)
+    if not ROMData.data.initialized then ROMData.init() end
+    local column = ROMData.data.pokemon and ROMData.data.pokemon[field]
+    return column and column[species]
+end
+
 -- Get move with proper name
 function ROMData.getMove(moveId)
     if not ROMData.data.initialized then ROMData.init() end
@@ -850,7 +1084,8 @@ function ROMData.getItem(itemId)
     
     -- Add name if missing
     if item and (not item.name or item.name == "") then
-        item.name = ROMData.getItemName(itemId)
+        local name = readItemName(itemId)
+        item.name = name ~= "" and name or ROMData.getItemName(itemId)
     end
     
     return item
@@ -880,10 +1115,7 @@ end
 function ROMData.getTypeEffectiveness(attackType, defenseType)
     if not ROMData.data.initialized then ROMData.init() end
     
-    if ROMData.data.typeChart[attackType] then
-        return ROMData.data.typeChart[attackType][defenseType] or 10  -- Default to normal damage
-    end
-    return 10
+    return chartEffectiveness(ROMData.data.typeChart, attackType, defenseType)
 end
 
 -- Test function
@@ -900,12 +1132,12 @@ function ROMData.test()
         console.log(string.format("✓ #001 %s", bulbasaur.name or "???"))
         console.log(string.format("  BST: %d (HP:%d ATK:%d DEF:%d SPE:%d SPA:%d SPD:%d)",
             bulbasaur.bst,
-            bulbasaur.stats.hp,
-            bulbasaur.stats.attack,
-            bulbasaur.stats.defense,
-            bulbasaur.stats.speed,
-            bulbasaur.stats.spAttack,
-            bulbasaur.stats.spDefense
+            bulbasaur.hp,
+            bulbasaur.attack,
+            bulbasaur.defense,
+            bulbasaur.speed,
+            bulbasaur.spAttack,
+            bulbasaur.spDefense
         ))
         console.log(string.format("  Types: %s/%s", 
             ROMData.getTypeName(bulbasaur.type1) or "???",
@@ -3,52 +3,27 @@
 Add missing battle functions to Pointers.lua
 """
 
+import contextlib
+import mmap
+import os
+import re
+import shutil
 from pathlib import Path
 
-def add_battle_functions():
-    """Add the missing getBattleState and getEnemyPartyAddress functions"""
-    
-    print("🔧 Adding missing battle functions to Pointers.lua...")
-    
-    # Find Pointers.lua
-    search_paths = [
-        Path("Pointers.lua"),
-        Path("PokemonEmeraldReader/Pointers.lua"),
-        Path("./PokemonEmeraldReader/Pointers.lua")
-    ]
-    
-    pointers_file = None
-    for path in search_paths:
-        if path.exists():
-            pointers_file = path
-            break
-    
-    if not pointers_file:
-        print("❌ Could not find Pointers.lua!")
-        return False
-    
-    print(f"📄 Found Pointers.lua at: {pointers_file}")
-    
-    # Read the file
-    with open(pointers_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Check if functions already exist
-    if "function Pointers.getBattleState" in content:
-        print("✓ getBattleState already exists")
-        return True
-    
-    # Find the return statement
-    return_pos = content.rfind("return Pointers")
-    if return_pos == -1:
-        print("⚠️  No 'return Pointers' found, adding at end")
-        insert_pos = len(content)
-        content += "\n"
-    else:
-        insert_pos = return_pos
-    
-    # Battle functions to add
-    battle_functions = '''
+# Directories searched for Pointers.lua
+SEARCH_DIRS = (".", "PokemonEmeraldReader")
+
+# Old and corrected gBattleTypeFlags assignments
+OLD_BATTLE_ADDRESS = b"gBattleTypeFlags = 0x030042DC"
+NEW_BATTLE_ADDRESS = b"gBattleTypeFlags = 0x02022FEC"
+
+# Anchors located in a single pass over Pointers.lua
+ANCHOR_PATTERN = re.compile(
+    rb"(function Pointers\.getBattleState)|(return Pointers)|(" + re.escape(OLD_BATTLE_ADDRESS) + rb")"
+)
+
+# Battle functions to add (encoded once at import)
+BATTLE_FUNCTIONS = '''
 -- NEW: Get battle state
 function Pointers.getBattleState()
     local battleFlags = Memory.read_u16_le(Pointers.addresses.gBattleTypeFlags)
@@ -75,33 +50,118 @@ function Pointers.getEnemyPartyAddress()
     return playerParty + 0x4C0
 end
 
-'''
+'''.encode('utf-8')
+
+def write_segments(f, segments):
+    """Write byte segments to an unbuffered file, gathered into one writev where available"""
+    if not hasattr(os, "writev"):
+        # Windows: sequential writes, resuming any short write on the unbuffered file
+        for segment in segments:
+            view = memoryview(segment)
+            while view:
+                view = view[f.write(view):]
+        return
+    
+    views = [memoryview(segment) for segment in segments if segment]
+    while views:
+        written = os.writev(f.fileno(), views)
+        # Drop fully written segments and resume any short write
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if views:
+            views[0] = views[0][written:]
+
+def add_battle_functions():
+    """Add the missing getBattleState and getEnemyPartyAddress functions"""
+    
+    print("🔧 Adding missing battle functions to Pointers.lua...")
     
-    # Insert the functions
-    new_content = content[:insert_pos] + battle_functions + content[insert_pos:]
+    # Find Pointers.lua (one directory read per location instead of a stat per path)
+    pointers_file = None
+    for search_dir in SEARCH_DIRS:
+        try:
+            with os.scandir(search_dir) as entries:
+                for entry in entries:
+                    if entry.name == "Pointers.lua" and entry.is_file():
+                        pointers_file = Path(entry.path)
+                        break
+        except OSError:
+            continue
+        if pointers_file:
+            break
     
-    # Save backup
+    if not pointers_file:
+        print("❌ Could not find Pointers.lua!")
+        return False
+    
+    print(f"📄 Found Pointers.lua at: {pointers_file}")
+    
+    # Map the file and scan it in place rather than copying it into a bytes object
+    with open(pointers_file, 'rb') as f:
+        # Empty files can't be mapped; scan them as b'' so the functions are still appended
+        if os.fstat(f.fileno()).st_size == 0:
+            mapping = contextlib.nullcontext(b'')
+        else:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        with mapping as content:
+            # Locate every anchor we care about in a single pass over the file
+            has_battle_state = False
+            return_pos = -1
+            old_addr_positions = []
+            for match in ANCHOR_PATTERN.finditer(content):
+                if match.lastindex == 1:
+                    has_battle_state = True
+                    break
+                elif match.lastindex == 2:
+                    return_pos = match.start()
+                else:
+                    old_addr_positions.append(match.start())
+            
+            # Check if functions already exist
+            if has_battle_state:
+                print("✓ getBattleState already exists")
+                return True
+            
+            # Match the inserted text to the file's line endings
+            newline = b"\r\n" if content.find(b"\r\n") != -1 else b"\n"
+            
+            # Split around the (last) return statement
+            if return_pos == -1:
+                print("⚠️  No 'return Pointers' found, adding at end")
+                split_pos = len(content)
+                head = content[:]
+                tail = newline
+            else:
+                split_pos = return_pos
+                head = content[:return_pos]
+                tail = content[return_pos:]
+    
+    # Save backup (kernel-side copy of the untouched original)
     backup_path = str(pointers_file) + ".backup"
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    shutil.copyfile(pointers_file, backup_path)
     print(f"📋 Backup saved to: {backup_path}")
     
-    # Write updated file
-    with open(pointers_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    # Fix the battle address only in the segment(s) that contain it
+    fix_address = bool(old_addr_positions)
+    if fix_address:
+        if old_addr_positions[0] < split_pos:
+            head = head.replace(OLD_BATTLE_ADDRESS, NEW_BATTLE_ADDRESS)
+        if old_addr_positions[-1] >= split_pos:
+            tail = tail.replace(OLD_BATTLE_ADDRESS, NEW_BATTLE_ADDRESS)
+    
+    # Write updated file once, via a temp file so a crash can't leave it half-written.
+    # The functions are spliced in by the write itself, so no joined copy is built.
+    tmp_path = str(pointers_file) + ".tmp"
+    with open(tmp_path, 'wb', buffering=0) as f:
+        write_segments(f, (head, BATTLE_FUNCTIONS.replace(b"\n", newline), tail))
+        os.fsync(f.fileno())
+    os.replace(tmp_path, pointers_file)
     
     print("✅ Added battle functions successfully!")
-    
-    # Also fix the battle address if needed
-    if "gBattleTypeFlags = 0x030042DC" in new_content:
-        print("\n🔧 Updating gBattleTypeFlags address...")
-        new_content = new_content.replace(
-            "gBattleTypeFlags = 0x030042DC",
-            "gBattleTypeFlags = 0x02022FEC"
-        )
-        with open(pointers_file, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        print("✅ Updated battle address")
+    if fix_address:
+        print("✅ Updated gBattleTypeFlags address")
     
     return True
 
@@ -54,27 +54,33 @@ local searchAreas = {
 for _, area in ipairs(searchAreas) do
     console.log("Searching " .. area.name .. "...")
     
-    for addr = area.start, area.start + area.size - 4, 4 do
-        local count = Memory.read_u32_le(addr)
-        
-        -- Look for valid party count (1-6)
-        if count and count >= 1 and count <= 6 then
-            -- Check if next data looks like Pokemon (personality value)
-            local personality = Memory.read_u32_le(addr + 4)
-            if personality and personality > 0 and personality < 0xFFFFFFFF then
-                -- Check for reasonable stats
-                local hp = Memory.read_u16_le(addr + 4 + 86)
-                local maxHp = Memory.read_u16_le(addr + 4 + 88)
-                
-                if hp and maxHp and hp <= maxHp and maxHp > 0 and maxHp < 1000 then
-                    console.log(string.format("\n✓ Possible party found at 0x%08X!", addr))
-                    console.log(string.format("  Count: %d", count))
-                    console.log(string.format("  First Pokemon HP: %d/%d", hp, maxHp))
+    -- One bulk read per area (padded so the last candidate's HP words are included)
+    local bytes = Memory.readbyterange(area.start, area.size + 92)
+    if not bytes then
+        console.log("  Failed to read " .. area.name)
+    else
+        for o = 0, area.size - 4, 4 do
+            local count = bytes[o]
+            
+            -- Look for valid party count (1-6)
+            if count >= 1 and count <= 6 and bytes[o + 1] == 0 and bytes[o + 2] == 0 and bytes[o + 3] == 0 then
+                -- Check if next data looks like Pokemon (personality value)
+                local personality = bytes[o + 4] + bytes[o + 5] * 0x100 + bytes[o + 6] * 0x10000 + bytes[o + 7] * 0x1000000
+                if personality > 0 and personality < 0xFFFFFFFF then
+                    -- Check for reasonable stats
+                    local hp = bytes[o + 90] + bytes[o + 91] * 0x100
+                    local maxHp = bytes[o + 92] + bytes[o + 93] * 0x100
                     
-                    -- Try to read species
-                    local species = Memory.read_u16_le(addr + 4 + 32)
-                    if species and species > 0 and species < 500 then
-                        console.log(string.format("  Species ID: %d", species))
+                    if hp <= maxHp and maxHp > 0 and maxHp < 1000 then
+                        console.log(string.format("\n✓ Possible party found at 0x%08X!", area.start + o))
+                        console.log(string.format("  Count: %d", count))
+                        console.log(string.format("  First Pokemon HP: %d/%d", hp, maxHp))
+                        
+                        -- Try to read species
+                        local species = bytes[o + 36] + bytes[o + 37] * 0x100
+                        if species > 0 and species < 500 then
+                            console.log(string.format("  Species ID: %d", species))
+                        end
                     end
                 end
             end
@@ -4,89 +4,118 @@ Fix Pointers.lua by moving 'return Pointers' to the end of the file
 """
 
 from pathlib import Path
+import contextlib
+import mmap
+import os
 import re
+import shutil
+
+# Patterns used by the fixer, compiled once (the file is handled as raw ASCII bytes)
+_RE_RETURN = re.compile(rb'return\s+Pointers\s*\n?')
+_RE_RETURN_FIND = re.compile(rb'return\s+Pointers')
+_RE_BATTLE = re.compile(rb'function\s+Pointers\.getBattleState')
+
+def _find_first(candidates):
+    """Return the first candidate path string that exists, listing each parent directory only once"""
+    listings = {}
+    for path in candidates:
+        parent, name = os.path.split(path)
+        parent = os.path.normpath(parent or ".")
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = set()
+        if name in listings[parent]:
+            return path
+    return None
+
+def _map_readonly(f):
+    """Read-only memory map of an open file (empty files can't be mapped, so they give b'')"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _newline(data):
+    """Line ending used by data: CRLF if it has any, otherwise LF"""
+    return b'\r\n' if data.find(b'\r\n') != -1 else b'\n'
 
 def fix_return_statement():
     """Move the return statement to the end of the file"""
     
     print("🔧 Fixing Pointers.lua return statement position...")
     
-    # Find Pointers.lua
+    # Find Pointers.lua (plain strings; only the match becomes a Path)
     search_paths = [
-        Path("Pointers.lua"),
-        Path("PokemonEmeraldReader/Pointers.lua"),
-        Path("./PokemonEmeraldReader/Pointers.lua")
+        "Pointers.lua",
+        "PokemonEmeraldReader/Pointers.lua",
+        "./PokemonEmeraldReader/Pointers.lua"
     ]
     
-    pointers_file = None
-    for path in search_paths:
-        if path.exists():
-            pointers_file = path
-            break
+    pointers_file = _find_first(search_paths)
     
     if not pointers_file:
         print("❌ Could not find Pointers.lua!")
         return False
+    pointers_file = Path(pointers_file)
     
     print(f"📄 Found Pointers.lua at: {pointers_file}")
     
-    # Read the file
-    with open(pointers_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Check if return is in wrong place
-    return_matches = list(re.finditer(r'return\s+Pointers', content))
-    battle_matches = list(re.finditer(r'function\s+Pointers\.getBattleState', content))
+    # Check if return is in wrong place (scanned through a read-only map, so a
+    # file that is already correct is never copied into memory)
+    with open(pointers_file, 'rb') as f, _map_readonly(f) as data:
+        return_match = _RE_RETURN_FIND.search(data)
+        
+        # Check if any battle functions come after return (stops at the first one)
+        functions_after_return = (return_match is not None and
+                                  _RE_BATTLE.search(data, return_match.start() + 1) is not None)
+        
+        if return_match and not functions_after_return:
+            print("✓ Return statement is already in correct position")
+            return True
+        
+        content = data[:]
+        newline = _newline(data)
     
-    if not return_matches:
+    if not return_match:
         print("⚠️  No 'return Pointers' found!")
-        content = content.rstrip() + "\n\nreturn Pointers\n"
+        content = content.rstrip() + newline + newline + b"return Pointers" + newline
     else:
-        return_pos = return_matches[0].start()
+        print("🔍 Found functions AFTER return statement - fixing...")
         
-        # Check if any battle functions come after return
-        functions_after_return = False
-        if battle_matches:
-            for match in battle_matches:
-                if match.start() > return_pos:
-                    functions_after_return = True
-                    break
+        # Remove all return statements
+        content = _RE_RETURN.sub(b'', content)
         
-        if functions_after_return:
-            print("🔍 Found functions AFTER return statement - fixing...")
-            
-            # Remove all return statements
-            content = re.sub(r'return\s+Pointers\s*\n?', '', content)
-            
-            # Add return at the very end
-            content = content.rstrip() + "\n\nreturn Pointers\n"
-        else:
-            print("✓ Return statement is already in correct position")
-            return True
+        # Add return at the very end (in the file's own line endings)
+        content = content.rstrip() + newline + newline + b"return Pointers" + newline
     
-    # Save backup
+    # Save backup (a hard link to the current file where supported, so no data is
+    # copied; the write below replaces the path with a new file, leaving the link intact)
     backup_path = str(pointers_file) + ".backup_return"
-    with open(pointers_file, 'r', encoding='utf-8') as f:
-        backup_content = f.read()
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        f.write(backup_content)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(backup_path)
+    try:
+        os.link(pointers_file, backup_path)
+    except OSError:
+        shutil.copyfile(pointers_file, backup_path)
     print(f"📋 Backup saved to: {backup_path}")
     
-    # Write fixed file
-    with open(pointers_file, 'w', encoding='utf-8') as f:
+    # Write fixed file to a temp file and swap it in, so an interrupted run never
+    # leaves a half-written Pointers.lua
+    tmp_path = str(pointers_file) + ".tmp"
+    with open(tmp_path, 'wb') as f:
         f.write(content)
+    os.replace(tmp_path, pointers_file)
     
     print("✅ Fixed! 'return Pointers' is now at the end of the file")
     
-    # Verify the fix
+    # Verify the fix (on the bytes just written verbatim, no need to read them back)
     print("\n🔍 Verifying fix...")
-    with open(pointers_file, 'r', encoding='utf-8') as f:
-        new_content = f.read()
-    
-    last_return = new_content.rfind('return Pointers')
+    last_return = content.rfind(b'return Pointers')
     last_function = max(
-        new_content.rfind('function Pointers.getBattleState'),
-        new_content.rfind('function Pointers.getEnemyPartyAddress')
+        content.rfind(b'function Pointers.getBattleState'),
+        content.rfind(b'function Pointers.getEnemyPartyAddress')
     )
     
     if last_return > last_function:
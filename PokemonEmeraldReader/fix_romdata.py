@@ -6,77 +6,118 @@ Adds compatibility wrappers and updates bit.* calls
 
 import os
 import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Compatibility header to add to files
-COMPAT_HEADER = '''-- Bitwise operation compatibility
-local band = _VERSION >= "Lua 5.3" and function(a,b) return a & b end or bit.band
-local bor = _VERSION >= "Lua 5.3" and function(a,b) return a | b end or bit.bor
-local bxor = _VERSION >= "Lua 5.3" and function(a,b) return a ~ b end or bit.bxor
-local bnot = _VERSION >= "Lua 5.3" and function(a) return ~a end or bit.bnot
-local lshift = _VERSION >= "Lua 5.3" and function(a,b) return a << b end or bit.lshift
-local rshift = _VERSION >= "Lua 5.3" and function(a,b) return a >> b end or bit.rshift
+# Compatibility header to add to files (ASCII bytes, files are patched in binary mode)
+COMPAT_HEADER = b'''-- Bitwise operation compatibility (picked once at load; 5.3+ operators compiled from source)
+local band, bor, bxor, bnot, lshift, rshift
+if _VERSION >= "Lua 5.3" then
+    band, bor, bxor, bnot, lshift, rshift = assert(load([[
+        return function(a,b) return a & b end,
+               function(a,b) return a | b end,
+               function(a,b) return a ~ b end,
+               function(a) return ~a end,
+               function(a,b) return a << b end,
+               function(a,b) return a >> b end
+    ]]))()
+else
+    band, bor, bxor, bnot = bit.band, bit.bor, bit.bxor, bit.bnot
+    lshift, rshift = bit.lshift, bit.rshift
+end
 
 '''
 
+# Any bit.* reference (calls or the header's own fallbacks)
+_RE_BIT_ANY = re.compile(rb'bit\.\w')
+
+# bit.band( -> band( etc., rewritten in one pass
+_RE_BIT = re.compile(rb'bit\.(band|bor|bxor|bnot|lshift|rshift)\(')
+
+# First line that isn't blank, a comment, a local or a require
+_RE_INSERT = re.compile(rb'^(?!local)(?![^\S\n]*--)(?![^\n]*require)[^\n]*\S', re.MULTILINE)
+
+def _lua_files(directory):
+    """Names of the .lua files in directory (one directory read, empty if missing)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.name.endswith('.lua')}
+    except OSError:
+        return set()
+
+def _newline(content):
+    """Line ending used by content: CRLF if it has any, otherwise LF"""
+    return b'\r\n' if b'\r\n' in content else b'\n'
+
 def fix_lua_file(filepath):
-    """Fix bitwise operations in a Lua file"""
+    """Fix bitwise operations in a Lua file (output is written in one piece, so concurrent runs don't interleave)"""
+    
+    logs = []
+    try:
+        return _fix_lua_file(filepath, logs)
+    finally:
+        # Emitted even when the fix raises, so the lines leading up to the error aren't lost
+        if logs:
+            sys.stdout.write('\n'.join(logs) + '\n')
+
+def _fix_lua_file(filepath, logs):
+    """Body of fix_lua_file; appends its messages to logs"""
     
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with open(filepath, 'rb') as f:
         content = f.read()
     
     # Check if file uses bit operations
-    if not re.search(r'bit\.\w+', content):
-        print(f"  No bit operations found in {filepath.name}")
+    if not _RE_BIT_ANY.search(content):
+        logs.append(f"  No bit operations found in {filepath.name}")
         return False
     
-    # Check if already fixed
-    if "Bitwise operation compatibility" in content:
-        print(f"  Already fixed: {filepath.name}")
-        return False
-    
-    print(f"  Fixing {filepath.name}...")
-    
-    # Add compatibility header after initial comments and requires
-    lines = content.split('\n')
-    insert_pos = 0
+    original = content
     
-    # Find where to insert (after initial comments and local requires)
-    for i, line in enumerate(lines):
-        if line.strip() and not line.strip().startswith('--') and not line.startswith('local') and 'require' not in line:
-            insert_pos = i
-            break
-        if 'require' in line:
-            insert_pos = i + 1
-    
-    # Insert compatibility header
-    lines.insert(insert_pos, COMPAT_HEADER)
-    content = '\n'.join(lines)
+    # Add compatibility header (unless an earlier run already did) after initial comments and requires
+    if b"Bitwise operation compatibility" not in content:
+        match = _RE_INSERT.search(content)
+        if match:
+            insert_pos = match.start()
+        else:
+            # Nothing but comments, locals and requires: go after the last require line
+            last_require = content.rfind(b'require')
+            line_end = content.find(b'\n', last_require)
+            if last_require == -1:
+                insert_pos = 0
+            elif line_end == -1:
+                insert_pos = None  # The require is the last line, header goes below it
+            else:
+                insert_pos = line_end + 1
+        
+        # Insert compatibility header (in the file's own line endings)
+        newline = _newline(content)
+        header = COMPAT_HEADER.replace(b'\n', newline)
+        if insert_pos is None:
+            content = content + newline + header
+        else:
+            content = content[:insert_pos] + header + newline + content[insert_pos:]
     
     # Replace bit.* calls with local functions
-    replacements = [
-        (r'bit\.band\(', 'band('),
-        (r'bit\.bor\(', 'bor('),
-        (r'bit\.bxor\(', 'bxor('),
-        (r'bit\.bnot\(', 'bnot('),
-        (r'bit\.lshift\(', 'lshift('),
-        (r'bit\.rshift\(', 'rshift('),
-    ]
+    content = _RE_BIT.sub(rb'\1(', content)
+    
+    # Nothing changed (header in place, no bit.* calls left): skip the backup and write
+    if content == original:
+        logs.append(f"  Already fixed: {filepath.name}")
+        return False
     
-    for old, new in replacements:
-        content = re.sub(old, new, content)
+    logs.append(f"  Fixing {filepath.name}...")
     
-    # Save backup
+    # Save backup (a copy of the untouched file on disk)
     backup_path = filepath.with_suffix('.lua.backup')
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    shutil.copy2(filepath, backup_path)
     
     # Write fixed version
-    with open(filepath, 'w', encoding='utf-8') as f:
+    with open(filepath, 'wb') as f:
         f.write(content)
     
-    print(f"    ✓ Fixed and backed up to {backup_path.name}")
+    logs.append(f"    ✓ Fixed and backed up to {backup_path.name}")
     return True
 
 def main():
@@ -90,15 +131,15 @@ def main():
     else:
         # Try to find the files
         search_dirs = [
-            Path("./PokemonEmeraldReader"),
-            Path("."),
-            Path(".."),
+            "./PokemonEmeraldReader",
+            ".",
+            "..",
         ]
         
         search_dir = None
         for d in search_dirs:
-            if d.exists() and any(d.glob("*.lua")):
-                search_dir = d
+            if _lua_files(d):
+                search_dir = Path(d)
                 break
         
         if not search_dir:
@@ -116,15 +157,18 @@ def main():
         "Pointers.lua"
     ]
     
-    fixed_count = 0
+    present = _lua_files(search_dir)
     for filename in target_files:
-        filepath = search_dir / filename
-        if filepath.exists():
-            if fix_lua_file(filepath):
-                fixed_count += 1
-        else:
+        if filename not in present:
             print(f"  Skipping {filename} (not found)")
     
+    # The files are independent, so fix them concurrently
+    paths = [search_dir / filename for filename in target_files if filename in present]
+    fixed_count = 0
+    if paths:
+        with ThreadPoolExecutor(max_workers=min(4, len(paths))) as executor:
+            fixed_count = sum(1 for fixed in executor.map(fix_lua_file, paths) if fixed)
+    
     print(f"\n✓ Fixed {fixed_count} files")
     print("\nThe bitwise warnings should now be gone!")
     print("Run your tool again to test.")
@@ -7,6 +7,7 @@ local Memory = require("Memory")
 local ROMData = require("ROMData")
 local Pointers = require("Pointers")
 local PokemonReader = require("PokemonReader")
+local BattleDisplay = require("BattleDisplay")
 
 -- Optional JSON library for external output
 local hasJson, json = pcall(require, "json")
@@ -43,10 +44,13 @@ local State = {
     
     -- Current data
     party = nil,
+    partySnapshot = nil,        -- Raw party block bytes behind the data in party
+    lastDisplayKey = nil,       -- Everything that went into what is currently on screen
     playerInfo = nil,
     
     -- Statistics
     startTime = os.clock(),
+    cachedRuntime = 0,          -- Seconds since start, sampled on full updates
     totalReads = 0,
 }
 
@@ -63,15 +67,12 @@ function init()
     local isEmerald = false
     local gameInfo = "Unknown"
     
+    -- One read covers the ROM title (0xA0, 12 bytes) and the game code right after it
+    local header = Memory.readbyterange(0x080000A0, 16)
+    
     -- Method 1: Standard game code location
-    local gameCode = Memory.readbytes(0x080000AC, 4)
-    if gameCode then
-        local codeStr = ""
-        for i, byte in ipairs(gameCode) do
-            if byte then
-                codeStr = codeStr .. string.char(byte)
-            end
-        end
+    if header then
+        local codeStr = string.char(header[12], header[13], header[14], header[15])
         
         if codeStr == "BPEE" then
             isEmerald = true
@@ -83,11 +84,11 @@ function init()
         console.log("Warning: Could not read game code at standard location")
     end
     
-    -- Method 2: Check ROM title
-    local romTitle = Memory.readstring(0x080000A0, 12)
-    if romTitle and romTitle:find("POKEMON EMER") then
-        isEmerald = true
-        if gameInfo == "Unknown" then
+    -- Method 2: Check ROM title (only needed if the game code didn't match)
+    if not isEmerald and header then
+        local romTitle = string.char((table.unpack or unpack)(header, 0, 11))
+        if romTitle == "POKEMON EMER" then
+            isEmerald = true
             gameInfo = "Pokemon Emerald (Modified Header)"
         end
     end
@@ -174,12 +175,35 @@ function update()
     end
 end
 
+-- Exact key of everything displayParty shows (nil = always redraw)
+local function displayKey()
+    if not State.partySnapshot then return nil end
+    
+    if not State.playerInfo then
+        return State.partySnapshot
+    end
+    local minutes = math.floor((State.playerInfo.playTimeFrames or 0) * 60 / 3600)
+    return string.format("%d:%d:%d:", State.playerInfo.money or 0, State.playerInfo.playTimeHours or 0, minutes) ..
+        State.partySnapshot
+end
+
 -- Quick update - just refresh current party
 function quickUpdate()
-    -- Read party
-    State.party = PokemonReader.readParty()
+    -- Read party (only decode again when the raw party memory changed)
+    local snapshot = PokemonReader.partySnapshot()
+    if not State.party or not snapshot or snapshot ~= State.partySnapshot then
+        State.party = PokemonReader.readParty()
+        State.partySnapshot = snapshot
+    end
     State.totalReads = State.totalReads + 1
     
+    -- Nothing on screen would change, skip the redraw
+    local displayed = displayKey()
+    if displayed and displayed == State.lastDisplayKey then
+        return
+    end
+    State.lastDisplayKey = displayed
+    
     -- Update display
     displayParty()
     
@@ -193,6 +217,9 @@ end
 function fullUpdate()
     -- Clear pointer cache to ensure fresh data
     Pointers.clearCache()
+    State.partySnapshot = nil
+    State.lastDisplayKey = nil
+    State.cachedRuntime = os.clock() - State.startTime
     
     -- Read player info
     State.playerInfo = Pointers.getPlayerInfo()
@@ -201,95 +228,108 @@ function fullUpdate()
     quickUpdate()
 end
 
+-- Scratch line buffer reused by every display refresh
+local displayLines = {}
+
 -- Display party information
 function displayParty()
-    console.clear()
+    -- Build the whole screen, then clear and log it in one call
+    local lines = displayLines
+    local n = 0
     
     -- Header
-    console.log("=== Pokemon Party Monitor ===")
+    n = n + 1
+    lines[n] = "=== Pokemon Party Monitor ==="
     if Config.archipelagoMode then
-        console.log("(Archipelago Mode)")
+        n = n + 1
+        lines[n] = "(Archipelago Mode)"
     end
     
     -- Player info
     if State.playerInfo then
         local hours = State.playerInfo.playTimeHours or 0
         local minutes = math.floor((State.playerInfo.playTimeFrames or 0) * 60 / 3600)
-        console.log(string.format("Trainer ID: %05d | Money: $%d | Time: %d:%02d",
+        n = n + 1
+        lines[n] = string.format("Trainer ID: %05d | Money: $%d | Time: %d:%02d",
             State.playerInfo.trainerId or 0,
             State.playerInfo.money or 0,
-            hours, minutes))
+            hours, minutes)
     end
     
-    console.log("-----------------------------")
+    n = n + 1
+    lines[n] = "-----------------------------"
     
     -- Party Pokemon
     if State.party and State.party.count > 0 then
-        console.log(string.format("Party: %d/6 Pokemon\n", State.party.count))
+        n = n + 1
+        lines[n] = string.format("Party: %d/6 Pokemon\n", State.party.count)
         
-        for i, pokemon in ipairs(State.party.pokemon) do
-            if pokemon then
-                displayPokemon(i, pokemon)
+        for i = 1, State.party.count do
+            if State.party.pokemon[i] then
+                n = displayPokemon(lines, n, State.party, i)
             end
         end
     else
-        console.log("No Pokemon in party")
+        n = n + 1
+        lines[n] = "No Pokemon in party"
     end
     
     -- Footer stats
-    console.log("\n-----------------------------")
+    n = n + 1
+    lines[n] = "\n-----------------------------"
     local stats = Memory.getStats()
-    local runtime = os.clock() - State.startTime
-    console.log(string.format("Runtime: %.1fs | Updates: %d | Memory reads: %d",
-        runtime, State.totalReads, stats.reads))
+    n = n + 1
+    lines[n] = string.format("Runtime: %.1fs | Updates: %d | Memory reads: %d",
+        State.cachedRuntime, State.totalReads, stats.reads)
     
     if stats.systemBusFallbacks > 0 then
-        console.log(string.format("System Bus used: %d times (extended EWRAM access)",
-            stats.systemBusFallbacks))
+        n = n + 1
+        lines[n] = string.format("System Bus used: %d times (extended EWRAM access)",
+            stats.systemBusFallbacks)
     end
     
     -- Debug info
     if Config.debugMode then
-        console.log("\n[DEBUG] Press D for stats, M for moves, I for IVs, E for export, R to refresh")
+        n = n + 1
+        lines[n] = "\n[DEBUG] Press D for stats, M for moves, I for IVs, E for export, R to refresh"
     end
+    
+    console.clear()
+    console.log(table.concat(lines, "\n", 1, n))
 end
 
--- Display individual Pokemon
-function displayPokemon(slot, pokemon)
+-- Append an individual Pokemon's lines to lines (ending at n); returns the new count
+function displayPokemon(lines, n, party, slot)
+    local pokemon = party.pokemon[slot]
     local info = PokemonReader.formatPokemon(pokemon)
     
     -- Basic info line
-    console.log(string.format("%d. %s (Lv.%s %s) %s",
-        slot,
-        info.name,
-        info.level,
-        info.species,
-        info.status and "[" .. info.status .. "]" or ""))
-    
-    -- HP bar
-    local hpPercent = 0
-    if pokemon.battleStats and pokemon.battleStats.maxHP and pokemon.battleStats.maxHP > 0 then
-        hpPercent = pokemon.battleStats.currentHP / pokemon.battleStats.maxHP
+    n = n + 1
+    lines[n] = slot .. ". " .. info.name .. " (Lv." .. info.level .. " " .. info.species .. ") " ..
+        (info.status and "[" .. info.status .. "]" or "")
+    
+    -- HP bar (from the party's HP columns; no max HP shows an empty bar)
+    local maxHP = party.maxHP[slot]
+    local hpBar
+    if maxHP > 0 then
+        hpBar = BattleDisplay.makeBar(party.currentHP[slot], maxHP, 20)
+    else
+        hpBar = BattleDisplay.makeBar(0, 1, 20)
     end
     
-    local barLength = 20
-    local filledBars = math.floor(hpPercent * barLength)
-    local hpBar = string.rep("█", filledBars) .. string.rep("░", barLength - filledBars)
-    
-    console.log(string.format("   HP: [%s] %s", hpBar, info.hp))
+    n = n + 1
+    lines[n] = "   HP: [" .. hpBar .. "] " .. info.hp
     
     -- Type, ability, nature, item
-    console.log(string.format("   %s | %s | %s | Item: %s",
-        info.types, info.ability, info.nature, info.item))
+    n = n + 1
+    lines[n] = "   " .. info.types .. " | " .. info.ability .. " | " .. info.nature .. " | Item: " .. info.item
     
     -- Detailed stats if enabled
-    if Config.showDetailedStats and pokemon.battleStats then
-        console.log(string.format("   Stats: ATK %d | DEF %d | SPE %d | SPA %d | SPD %d",
-            pokemon.battleStats.attack,
-            pokemon.battleStats.defense,
-            pokemon.battleStats.speed,
-            pokemon.battleStats.spAttack,
-            pokemon.battleStats.spDefense))
+    if Config.showDetailedStats and pokemon.stats then
+        local s = pokemon.stats
+        n = n + 1
+        lines[n] = string.format("   Stats: ATK %d | DEF %d | SPE %d | SPA %d | SPD %d",
+            s[2], s[3], s[4], s[5], s[6])
     end
     
     -- MOVES DISPLAY - ARCHIPELAGO COMPATIBLE VERSION
@@ -326,10 +366,12 @@ function displayPokemon(slot, pokemon)
         end
         
         if hasMoves then
-            console.log("   Moves: " .. table.concat(moveDisplay, " | "))
+            n = n + 1
+            lines[n] = "   Moves: " .. table.concat(moveDisplay, " | ")
         else
             if Config.debugMode then
-                console.log("   Moves: (no moves found)")
+                n = n + 1
+                lines[n] = "   Moves: (no moves found)"
             end
         end
         
@@ -349,31 +391,35 @@ function displayPokemon(slot, pokemon)
                         table.insert(moveIds, string.format("#%d", pokemon.moves[j]))
                     end
                 end
-                console.log("   [DEBUG] Raw Move IDs: " .. table.concat(moveIds, ", "))
-                console.log("   [DEBUG] Note: IDs > 354 are Archipelago custom moves")
+                n = n + 1
+                lines[n] = "   [DEBUG] Raw Move IDs: " .. table.concat(moveIds, ", ")
+                n = n + 1
+                lines[n] = "   [DEBUG] Note: IDs > 354 are Archipelago custom moves"
             end
         end
     end
     
     -- IVs/EVs if enabled
     if Config.showIVsEVs and pokemon.parsedIVs and pokemon.evs then
-        console.log(string.format("   IVs: %d/%d/%d/%d/%d/%d",
+        n = n + 1
+        lines[n] = string.format("   IVs: %d/%d/%d/%d/%d/%d\n   EVs: %d/%d/%d/%d/%d/%d",
             pokemon.parsedIVs.hp,
             pokemon.parsedIVs.attack,
             pokemon.parsedIVs.defense,
             pokemon.parsedIVs.speed,
             pokemon.parsedIVs.spAttack,
-            pokemon.parsedIVs.spDefense))
-        console.log(string.format("   EVs: %d/%d/%d/%d/%d/%d",
+            pokemon.parsedIVs.spDefense,
             pokemon.evs.hp,
             pokemon.evs.attack,
             pokemon.evs.defense,
             pokemon.evs.speed,
             pokemon.evs.spAttack,
-            pokemon.evs.spDefense))
+            pokemon.evs.spDefense)
     end
     
-    console.log("")  -- Blank line between Pokemon
+    n = n + 1
+    lines[n] = ""  -- Blank line between Pokemon
+    return n
 end
 
 -- Output data for external tools
@@ -402,6 +448,14 @@ end
 function handleInput()
     local keys = input.get()
     
+    -- Nothing held (the usual case), skip the key checks
+    if not keys or not next(keys) then return end
+    
+    -- Any toggle changes the layout, so redraw on the next update
+    if keys["D"] or keys["M"] or keys["I"] or keys["G"] then
+        State.lastDisplayKey = nil
+    end
+    
     -- Toggle options with keyboard
     if keys["D"] then
         Config.showDetailedStats = not Config.showDetailedStats
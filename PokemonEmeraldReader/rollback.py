@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """Rollback to backup created on backup_20250704_200857"""
+import os
 import shutil
 from pathlib import Path
 
@@ -7,9 +8,12 @@ backup = Path("backup_20250704_200857")
 current = Path(".")
 
 if backup.exists():
-    for lua_file in backup.glob("*.lua"):
-        shutil.copy2(lua_file, current / lua_file.name)
-        print(f"Restored: {lua_file.name}")
+    with os.scandir(backup) as entries:
+        for entry in entries:
+            if entry.name.endswith(".lua"):
+                # Contents only; copyfile skips the metadata copy and uses sendfile on Linux
+                shutil.copyfile(entry.path, current / entry.name)
+                print(f"Restored: {entry.name}")
     print("\nRollback complete!")
 else:
     print("Backup directory not found!")